@@ -2,6 +2,8 @@
 Base adapter classes and utilities for knowledge graph builders
 """
 
+from itertools import islice
+
 class KnowledgeGraphAdapter:
     """Base class for all knowledge graph adapters"""
     
@@ -17,6 +19,32 @@ class KnowledgeGraphAdapter:
         """Get edges for the knowledge graph"""
         raise NotImplementedError("Subclasses must implement get_edges()")
     
+    def get_node_batches(self, batch_size=10000):
+        """
+        Get nodes for the knowledge graph in lists of up to batch_size,
+        for loaders that write many nodes per call
+        """
+        return _batches(self.get_nodes(), batch_size)
+    
+    def get_edge_batches(self, batch_size=10000):
+        """
+        Get edges for the knowledge graph in lists of up to batch_size,
+        for loaders that write many edges per call
+        """
+        return _batches(self.get_edges(), batch_size)
+    
     def get_statistics(self):
         """Get statistics about the data"""
         return {}
+
+
+def _batches(items, batch_size):
+    """Yield lists of up to batch_size consecutive items"""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    items = iter(items)
+    batch = list(islice(items, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(items, batch_size))
@@ -51,14 +51,19 @@ class CivicAdapter(CivicBaseAdapter):
             if force or not os.path.exists(file_path):
                 self.logger.info(f"Downloading {os.path.basename(file_path)}...")
                 try:
-                    response = requests.get(url, timeout=300)  # 5 minute timeout
+                    response = requests.get(url, timeout=300, stream=True)  # 5 minute timeout
                     response.raise_for_status()
                     
                     # Ensure directory exists
                     os.makedirs(os.path.dirname(file_path), exist_ok=True)
                     
-                    with open(file_path, "w", encoding='utf-8') as f:
-                        f.write(response.text)
+                    # Stream the file to disk as downloaded, keeping the
+                    # server's bytes; rename it into place once complete
+                    partial_path = f"{file_path}.part"
+                    with open(partial_path, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=1024 * 1024):
+                            f.write(chunk)
+                    os.replace(partial_path, file_path)
                     
                     self.logger.info(f"✅ Downloaded {os.path.basename(file_path)}")
                     
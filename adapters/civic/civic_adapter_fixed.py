@@ -7,16 +7,26 @@ from . import CivicBaseAdapter
 import os
 import csv
 import logging
+import pickle
 import requests
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 class CivicAdapterFixed(CivicBaseAdapter):
     """Fixed adapter for CIViC data with correct relationships"""
     
-    def __init__(self, data_dir=None):
-        """Initialize the adapter"""
+    def __init__(self, data_dir=None, workers=None):
+        """
+        Initialize the adapter
+        
+        Args:
+            data_dir: Directory containing the CIViC TSV files
+            workers: Number of worker processes to parse the files with
+                (parsed serially when unset or 1)
+        """
         super().__init__(data_dir)
         self.logger = logging.getLogger(__name__)
+        self.workers = workers
         
         # File paths for TSV files (downloaded from URLs)
         self.features_file = os.path.join(self.data_dir, "01-Jul-2025-FeatureSummaries.tsv")
@@ -60,13 +70,18 @@ class CivicAdapterFixed(CivicBaseAdapter):
             if force or not os.path.exists(file_path):
                 self.logger.info(f"Downloading {os.path.basename(file_path)}...")
                 try:
-                    response = requests.get(url, timeout=300)
+                    response = requests.get(url, timeout=300, stream=True)
                     response.raise_for_status()
                     
                     os.makedirs(os.path.dirname(file_path), exist_ok=True)
                     
-                    with open(file_path, "w", encoding='utf-8') as f:
-                        f.write(response.text)
+                    # Stream the file to disk as downloaded, keeping the
+                    # server's bytes; rename it into place once complete
+                    partial_path = f"{file_path}.part"
+                    with open(partial_path, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=1024 * 1024):
+                            f.write(chunk)
+                    os.replace(partial_path, file_path)
                     
                     self.logger.info(f"✅ Downloaded {os.path.basename(file_path)}")
                     
@@ -83,22 +98,119 @@ class CivicAdapterFixed(CivicBaseAdapter):
         # Ensure files exist
         self._ensure_files_exist()
         
+        stamp = self._source_stamp()
+        if self._load_cache(stamp):
+            self.logger.info("Loaded parsed CIViC data from cache")
+            self._log_statistics()
+            return
+        
         # Parse in order: Features → Variant Groups → Variants → Molecular Profiles → Evidence → Assertions
-        self._parse_features()
-        self._parse_variant_groups()
-        self._parse_variants()
-        self._parse_molecular_profiles()
-        self._parse_evidence()
-        self._parse_assertions()
+        if self.workers and self.workers > 1:
+            self._parse_parallel(self.workers)
+        else:
+            self._parse_features()
+            self._parse_variant_groups()
+            self._parse_variants()
+            self._parse_molecular_profiles()
+            self._parse_evidence()
+            self._parse_assertions()
         
         self.logger.info("CIViC data parsing complete")
         self._log_statistics()
+        self._save_cache(stamp)
+
+    def _cache_path(self):
+        """Cache file for the parsed tables, next to the TSV files"""
+        return os.path.join(self.data_dir, ".civic_parsed.pkl")
+
+    def _source_stamp(self):
+        """
+        Cache format version plus the size and modification time of each
+        TSV file, to validate the cache
+        """
+        files = []
+        for file_path in self._source_files():
+            stat = os.stat(file_path)
+            files.append((os.path.basename(file_path), stat.st_size, stat.st_mtime_ns))
+        return (_CACHE_VERSION, files)
+
+    def _source_files(self):
+        """The CIViC TSV files the adapter parses"""
+        return [self.features_file, self.variants_file, self.variant_groups_file,
+                self.molecular_profiles_file, self.evidence_file, self.assertions_file]
+
+    def _load_cache(self, stamp):
+        """
+        Load the parsed tables from the cache written by a previous parse of
+        the same TSV files, so re-runs over unchanged files skip the parse.
+        
+        Args:
+            stamp: Current source stamp (see _source_stamp)
+            
+        Returns:
+            True if the tables were loaded, False if there is no valid cache
+        """
+        cache_path = self._cache_path()
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached["sources"] != stamp:
+                return False
+        except OSError:
+            return False
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+            return False
+        
+        for name in _CACHED_TABLES:
+            setattr(self, name, cached["tables"][name])
+        return True
+
+    def _save_cache(self, stamp):
+        """
+        Write the parsed tables to the cache for later runs (see _load_cache)
+        
+        Args:
+            stamp: Source stamp taken before the files were parsed
+        """
+        cache_path = self._cache_path()
+        cached = {
+            "sources": stamp,
+            "tables": {name: getattr(self, name) for name in _CACHED_TABLES},
+        }
+        try:
+            partial_path = f"{cache_path}.part"
+            with open(partial_path, "wb") as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache {cache_path}: {e}")
 
+    def _parse_parallel(self, workers):
+        """
+        Parse the summary files in a process pool and merge the tables each
+        one fills in the serial parse order, so the result matches the
+        serial parse. Variant groups are parsed here first, as the variants
+        look their descriptions up.
+        
+        Args:
+            workers: Number of worker processes
+        """
+        self._parse_variant_groups()
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(_PARSED_TABLES))) as executor:
+            futures = [
+                executor.submit(_parse_file, self.data_dir, method_name, self.variant_groups)
+                for method_name in _PARSED_TABLES
+            ]
+            for future in futures:
+                for name, table in future.result().items():
+                    getattr(self, name).update(table)
+    
     def _ensure_files_exist(self):
         """Ensure all required files exist, download if missing"""
         missing_files = []
-        for file_path in [self.features_file, self.variants_file, self.variant_groups_file, 
-                         self.molecular_profiles_file, self.evidence_file, self.assertions_file]:
+        for file_path in self._source_files():
             if not os.path.exists(file_path):
                 missing_files.append(file_path)
         
@@ -365,7 +477,9 @@ class CivicAdapterFixed(CivicBaseAdapter):
                     "data_source": "CIViC",
                     "civic_feature_id": feature_id
                 }
-                self.logger.debug(f"Extracted gene: {gene_id} (Entrez: {entrez_id}) from feature {feature_id}")
+                # Per-feature message: left to logging to format, so it
+                # costs nothing while debug logging is off
+                self.logger.debug("Extracted gene: %s (Entrez: %s) from feature %s", gene_id, entrez_id, feature_id)
         
         elif feature_type == "fusion" and name:
             # Create fusion node
@@ -376,7 +490,7 @@ class CivicAdapterFixed(CivicBaseAdapter):
                     "data_source": "CIViC",
                     "civic_feature_id": feature_id
                 }
-                self.logger.debug(f"Extracted fusion: {fusion_id} from feature {feature_id}")
+                self.logger.debug("Extracted fusion: %s from feature %s", fusion_id, feature_id)
 
     def _extract_therapies_from_evidence(self, row):
         """Extract therapy information from evidence row"""
@@ -653,3 +767,42 @@ class CivicAdapterFixed(CivicBaseAdapter):
         self.logger.info(f"Parsed {len(self.assertions)} assertions")
         self.logger.info(f"Extracted {len(self.diseases)} diseases")
         self.logger.info(f"Extracted {len(self.therapies)} therapies")
+
+
+# Version of the parse cache; bump it whenever the parsers change what
+# they store in the cached tables, so caches from older code are not reused
+_CACHE_VERSION = 1
+
+# Tables kept in the parse cache
+_CACHED_TABLES = (
+    "features", "genes", "fusions", "variant_groups", "variants",
+    "molecular_profiles", "evidence_items", "assertions", "diseases", "therapies",
+)
+
+# Tables filled by each file parser run in a worker, in serial parse order
+# (diseases and therapies from assertions override those from evidence)
+_PARSED_TABLES = {
+    "_parse_features": ("features", "genes", "fusions"),
+    "_parse_variants": ("variants",),
+    "_parse_molecular_profiles": ("molecular_profiles",),
+    "_parse_evidence": ("evidence_items", "diseases", "therapies"),
+    "_parse_assertions": ("assertions", "diseases", "therapies"),
+}
+
+
+def _parse_file(data_dir, method_name, variant_groups):
+    """
+    Run one file parser of CivicAdapterFixed in a worker process.
+    
+    Args:
+        data_dir: Directory containing the CIViC TSV files
+        method_name: Name of the parser method, a key of _PARSED_TABLES
+        variant_groups: Variant group descriptions by name
+        
+    Returns:
+        Table attribute name -> table, for the tables the parser fills
+    """
+    adapter = CivicAdapterFixed(data_dir=data_dir)
+    adapter.variant_groups = variant_groups
+    getattr(adapter, method_name)()
+    return {name: getattr(adapter, name) for name in _PARSED_TABLES[method_name]}
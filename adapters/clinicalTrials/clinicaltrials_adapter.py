@@ -1,10 +1,13 @@
+import functools
 import random
 import string
 import sys
 import os
-import hashlib
+import unicodedata
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum, auto
-from itertools import chain
+from itertools import chain, islice
 from typing import Optional
 from biocypher._logger import logger
 
@@ -13,7 +16,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 logger.debug(f"Loading module {__name__}.")
 
+import orjson
 import requests
+import xxhash
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Default query parameters - can be overridden by config
 DEFAULT_QUERY_PARAMS = {
@@ -49,6 +56,95 @@ DEFAULT_QUERY_PARAMS = {
 }
 
 
+# Common Unicode character mappings
+UNICODE_MAP = {
+    # Basic Latin accented characters
+    'á': 'a', 'à': 'a', 'ä': 'a', 'â': 'a', 'ã': 'a', 'å': 'a',
+    'é': 'e', 'è': 'e', 'ë': 'e', 'ê': 'e',
+    'í': 'i', 'ì': 'i', 'ï': 'i', 'î': 'i',
+    'ó': 'o', 'ò': 'o', 'ö': 'o', 'ô': 'o', 'õ': 'o',
+    'ú': 'u', 'ù': 'u', 'ü': 'u', 'û': 'u',
+    'ñ': 'n', 'ç': 'c',
+    'Á': 'A', 'À': 'A', 'Ä': 'A', 'Â': 'A', 'Ã': 'A', 'Å': 'A',
+    'É': 'E', 'È': 'E', 'Ë': 'E', 'Ê': 'E',
+    'Í': 'I', 'Ì': 'I', 'Ï': 'I', 'Î': 'I',
+    'Ó': 'O', 'Ò': 'O', 'Ö': 'O', 'Ô': 'O', 'Õ': 'O',
+    'Ú': 'U', 'Ù': 'U', 'Ü': 'U', 'Û': 'U',
+    'Ñ': 'N', 'Ç': 'C',
+    
+    # Extended Latin characters (Turkish, Polish, etc.)
+    'ş': 's', 'Ş': 'S',  # Turkish s with cedilla
+    'ğ': 'g', 'Ğ': 'G',  # Turkish g with breve
+    'ı': 'i', 'İ': 'I',  # Turkish dotless i / i with dot
+    'ž': 'z', 'Ž': 'Z',  # z with caron
+    'ł': 'l', 'Ł': 'L',  # Polish l with stroke
+    'ć': 'c', 'Ć': 'C',  # c with acute
+    'ś': 's', 'Ś': 'S',  # s with acute
+    'ź': 'z', 'Ź': 'Z',  # z with acute
+    'ż': 'z', 'Ż': 'Z',  # z with dot above
+    'ń': 'n', 'Ń': 'N',  # n with acute
+    'ř': 'r', 'Ř': 'R',  # r with caron
+    'š': 's', 'Š': 'S',  # s with caron
+    'č': 'c', 'Č': 'C',  # c with caron
+    'ď': 'd', 'Ď': 'D',  # d with caron
+    'ť': 't', 'Ť': 'T',  # t with caron
+    'ň': 'n', 'Ň': 'N',  # n with caron
+    'ů': 'u', 'Ů': 'U',  # u with ring above
+    'ē': 'e', 'Ē': 'E',  # e with macron
+    'ī': 'i', 'Ī': 'I',  # i with macron
+    'ā': 'a', 'Ā': 'A',  # a with macron
+    'ō': 'o', 'Ō': 'O',  # o with macron
+    'ū': 'u', 'Ū': 'U',  # u with macron
+    
+    # Special symbols and punctuation
+    '®': '',              # Registered trademark (remove)
+    '™': '',              # Trademark (remove)
+    '©': '',              # Copyright (remove)
+    '•': '-',             # Bullet point -> dash
+    '–': '-',             # En dash -> hyphen
+    '—': '-',             # Em dash -> hyphen
+    '\u2018': "'",        # Left single quotation mark
+    '\u2019': "'",        # Right single quotation mark
+    '\u201c': '"',        # Left double quotation mark
+    '\u201d': '"',        # Right double quotation mark
+    '…': '...',           # Horizontal ellipsis
+    
+    # Chinese/CJK punctuation
+    '，': ',',             # Chinese comma
+    '。': '.',             # Chinese period
+    '（': '(',             # Chinese left parenthesis
+    '）': ')',             # Chinese right parenthesis
+    '：': ':',             # Chinese colon
+    '；': ';',             # Chinese semicolon
+    '？': '?',             # Chinese question mark
+    '！': '!',             # Chinese exclamation mark
+}
+
+# UNICODE_MAP as a translation table; no replacement contains another
+# mapped character, so one translate pass matches chained replaces
+_UNICODE_TABLE = str.maketrans(UNICODE_MAP)
+
+# UNICODE_MAP followed by replace_quote (and replace_newline), as one table
+_CLEAN_TABLE = str.maketrans(
+    {
+        **{char: value.replace('"', "'") for char, value in UNICODE_MAP.items()},
+        '"': "'",
+    }
+)
+_CLEAN_NEWLINE_TABLE = str.maketrans({**_CLEAN_TABLE, ord("\n"): " | "})
+
+DATA_SOURCE = "ClinicalTrials.gov"
+
+# spaces and hyphens in condition names become underscores in disease IDs
+_DISEASE_ID_TABLE = str.maketrans(" -", "__")
+
+# Fixed-layout records for the most numerous node tables; field order is the
+# property order of the emitted nodes.
+_OutcomeRecord = namedtuple("_OutcomeRecord", "primary time_frame description")
+_InterventionRecord = namedtuple("_InterventionRecord", "type description mapped_names")
+_LocationRecord = namedtuple("_LocationRecord", "city state country")
+
+
 class ClinicalTrialsAdapterNodeType(Enum):
     """
     Define types of nodes the adapter can provide.
@@ -127,6 +223,29 @@ class ClinicalTrialsAdapterProteinDiseaseEdgeField(Enum):
     ASSOCIATION_SOURCE = "association_source"
 
 
+# protocolSection modules read by _preprocess_study for each node type
+_NODE_TYPE_MODULES = {
+    ClinicalTrialsAdapterNodeType.ORGANISATION: ("identificationModule",),
+    ClinicalTrialsAdapterNodeType.SPONSOR: ("sponsorCollaboratorsModule",),
+    ClinicalTrialsAdapterNodeType.OUTCOME: ("outcomesModule",),
+    ClinicalTrialsAdapterNodeType.DRUG: ("armsInterventionsModule",),
+    ClinicalTrialsAdapterNodeType.DISEASE: ("conditionsModule",),
+    ClinicalTrialsAdapterNodeType.LOCATION: ("contactsLocationsModule",),
+}
+
+# Studies per task when preprocessing in a process pool
+PREPROCESS_CHUNK_SIZE = 500
+
+# Edge column tables, concatenated in order when merging worker results
+_EDGE_TABLES = (
+    "_study_to_drug_edges",
+    "_study_to_disease_edges",
+    "_study_to_location_edges",
+    "_study_to_sponsor_edges",
+    "_study_to_outcome_edges",
+)
+
+
 class ClinicalTrialsAdapter:
     """
     ClinicalTrials BioCypher adapter. Generates nodes and edges for creating a
@@ -152,6 +271,7 @@ class ClinicalTrialsAdapter:
         )
 
         self.base_url = "https://clinicaltrials.gov/api/v2"
+        self._session = self._create_session()
 
         # Get query parameters from config or use defaults
         if config and config.get('clinical_trials', {}).get('query_params'):
@@ -169,56 +289,80 @@ class ClinicalTrialsAdapter:
         else:
             logger.info("No max_studies limit set - will fetch all available studies")
 
-        self._studies = self._get_studies(query_params, max_studies)
+        # Optional process pool for preprocessing; serial when unset
+        workers = None
+        if config and config.get('clinical_trials', {}).get('preprocess_workers'):
+            workers = config['clinical_trials']['preprocess_workers']
+            logger.info(f"Preprocessing studies with {workers} worker processes")
+
+        self._preprocess(self._iter_studies(query_params, max_studies), workers)
+
+    def _create_session(self):
+        """
+        Create a pooled HTTP session so paginated requests reuse one
+        keep-alive connection instead of a new TCP+TLS handshake per page.
+
+        Returns:
+            A configured requests.Session.
+        """
+        session = requests.Session()
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries),
+        )
+        session.headers.update({"Accept-Encoding": "gzip"})
+        return session
+
+    def _get_requested_fields(self):
+        """
+        Returns the protocolSection modules needed for the selected node
+        types and study fields, as a list of API field paths.
+        """
+        modules = {"identificationModule"}  # nctId
+
+        if self._has_study:
+            modules.update(path[0] for _, path in self._study_field_paths)
 
-        self._preprocess()
+        for node_type in self.node_types:
+            modules.update(_NODE_TYPE_MODULES.get(node_type, ()))
 
-    def _generate_edge_id(self, source_id: str, target_id: str, edge_type: str, properties: dict = None) -> str:
+        return [f"protocolSection.{module}" for module in sorted(modules)]
+
+    def _submit_page(self, executor, url, params, page_token):
         """
-        Generate a unique edge ID based on source, target, edge type, and properties.
-        
+        Submit the request for the page identified by `page_token`.
+
         Args:
-            source_id: Source node ID
-            target_id: Target node ID  
-            edge_type: Type of edge
-            properties: Edge properties (optional)
-            
+            executor: Executor to run the request on.
+            url: Studies endpoint URL.
+            params: Query parameters shared by all pages.
+            page_token: Token of the page to fetch.
+
         Returns:
-            Unique edge ID string
+            A future resolving to the page response.
         """
-        # Create a string to hash that includes all identifying information
-        id_components = [source_id, target_id, edge_type]
-        
-        # Add relevant properties to make edges unique
-        if properties:
-            # For outcome edges, include primary status to distinguish primary vs secondary
-            if edge_type == "study_has_outcome" and "primary" in properties:
-                id_components.append(f"primary_{properties['primary']}")
-            
-            # Add description if available to further distinguish edges
-            if "description" in properties and properties["description"] != "N/A":
-                id_components.append(properties["description"][:50])  # Limit length
-        
-        # Create hash of components
-        id_string = "|".join(str(comp) for comp in id_components)
-        edge_hash = hashlib.md5(id_string.encode()).hexdigest()[:12]  # Use first 12 chars
-        
-        # Create readable edge ID
-        edge_id = f"{edge_type}_{edge_hash}"
-        
-        return edge_id
-
-    def _get_studies(self, query_params, max_studies=None):
+        page_params = {**params, "pageToken": page_token}
+        return executor.submit(self._session.get, url, params=page_params, timeout=30)
+
+    def _iter_studies(self, query_params, max_studies=None):
         """
-        Get all studies fitting the parameters from the API.
-        Handles large-scale data fetching with proper pagination and memory management.
+        Stream all studies fitting the parameters from the API, page by page,
+        so each page can be released once its studies have been processed.
 
         Args:
             query_params: Dictionary of query parameters to pass to the API.
+            max_studies: Optional maximum number of studies to yield.
 
-        Returns:
-            A list of studies (dictionaries).
+        Yields:
+            Studies (dictionaries).
         """
+        fetched = 0
+
         try:
             url = f"{self.base_url}/studies"
             logger.info(f"Fetching studies from: {url}")
@@ -226,6 +370,11 @@ class ClinicalTrialsAdapter:
             # Clean up query parameters for API compatibility
             clean_params = query_params.copy()
             
+            # Unless the config asks for specific fields, only request the
+            # modules this adapter reads instead of full study documents
+            if 'fields' not in clean_params:
+                clean_params['fields'] = self._get_requested_fields()
+
             # Handle fields parameter properly - ClinicalTrials API expects comma-separated values
             if 'fields' in clean_params and isinstance(clean_params['fields'], list):
                 clean_params['fields'] = ','.join(clean_params['fields'])
@@ -236,76 +385,98 @@ class ClinicalTrialsAdapter:
             # Don't try to get total count first - it's causing API errors
             # Just start fetching data directly
             logger.info("Starting data fetch...")
-            response = requests.get(url, params=clean_params, timeout=30)
+            response = self._session.get(url, params=clean_params, timeout=30)
             response.raise_for_status()
             
-            result = response.json()
-            all_studies = result.get("studies", [])
-            logger.info(f"Initial batch: {len(all_studies)} studies")
+            result = orjson.loads(response.content)
+            first_batch = result.get("studies", [])
+            # Only the token is carried between pages; dropping the parsed
+            # page and its raw body lets them be reclaimed before the next one
+            token = result.get("nextPageToken")
+            del result, response
+            logger.info(f"Initial batch: {len(first_batch)} studies")
             
-            if len(all_studies) == 0:
+            if len(first_batch) == 0:
                 logger.warning("No studies returned in first batch")
-                return []
+                return
             
             # If max_studies is set and initial batch exceeds it, truncate
-            if max_studies and len(all_studies) > max_studies:
-                all_studies = all_studies[:max_studies]
+            if max_studies and len(first_batch) > max_studies:
                 logger.info(f"Truncated initial batch to {max_studies} studies (max_studies limit)")
-                return all_studies
+                yield from first_batch[:max_studies]
+                return
+
+            yield from first_batch
+            fetched = len(first_batch)
+            del first_batch
             
             # Handle pagination with progress tracking
             page_count = 1
             max_pages = 1000  # Safety limit - adjust based on needs
             
-            while result.get("nextPageToken") and page_count < max_pages:
-                # Check if we've reached the max_studies limit
-                if max_studies and len(all_studies) >= max_studies:
-                    logger.info(f"Reached max_studies limit of {max_studies:,}, stopping pagination")
-                    break
-                
-                clean_params["pageToken"] = result.get("nextPageToken")
-                page_count += 1
-                
-                logger.info(f"Fetching page {page_count}... ({len(all_studies):,} studies so far)")
-                
-                response = requests.get(url, params=clean_params, timeout=30)
-                response.raise_for_status()
-                
-                next_page = response.json()
-                if next_page.get("studies"):
-                    new_studies = next_page.get("studies")
+            # Each page token comes from the previous response, so only one
+            # request can be in flight; it is issued as soon as the token is
+            # known and overlaps with consuming the current page.
+            executor = ThreadPoolExecutor(max_workers=1)
+            pending = None
+
+            try:
+                while token and page_count < max_pages:
+                    # Check if we've reached the max_studies limit
+                    if max_studies and fetched >= max_studies:
+                        logger.info(f"Reached max_studies limit of {max_studies:,}, stopping pagination")
+                        break
                     
-                    # If adding all new studies would exceed max_studies, only add what we need
-                    if max_studies and len(all_studies) + len(new_studies) > max_studies:
-                        remaining_needed = max_studies - len(all_studies)
-                        new_studies = new_studies[:remaining_needed]
-                        logger.info(f"Limiting to {remaining_needed} studies to stay within max_studies limit")
+                    page_count += 1
                     
-                    all_studies.extend(new_studies)
-                    logger.info(f"Added {len(new_studies)} studies from page {page_count}")
-                
-                result["nextPageToken"] = next_page.get("nextPageToken")
-                
-                # Progress update every 10 pages
-                if page_count % 10 == 0:
-                    logger.info(f"Progress: {len(all_studies):,} studies fetched in {page_count} pages")
-                
-                # Memory management for very large datasets
-                if len(all_studies) > 50000 and page_count % 50 == 0:
-                    logger.info("Large dataset - consider processing in batches for better memory management")
+                    logger.info(f"Fetching page {page_count}... ({fetched:,} studies so far)")
+                    
+                    if pending is None:
+                        pending = self._submit_page(executor, url, clean_params, token)
+                    response = pending.result()
+                    pending = None
+                    response.raise_for_status()
+                    
+                    next_page = orjson.loads(response.content)
+                    token = next_page.get("nextPageToken")
+                    new_studies = next_page.get("studies") or []
+                    del next_page, response
+
+                    # Prefetch the following page while this one is consumed
+                    if (
+                        token
+                        and page_count < max_pages
+                        and not (max_studies and fetched + len(new_studies) >= max_studies)
+                    ):
+                        pending = self._submit_page(executor, url, clean_params, token)
+
+                    if new_studies:
+                        # If adding all new studies would exceed max_studies, only add what we need
+                        if max_studies and fetched + len(new_studies) > max_studies:
+                            remaining_needed = max_studies - fetched
+                            new_studies = new_studies[:remaining_needed]
+                            logger.info(f"Limiting to {remaining_needed} studies to stay within max_studies limit")
+                        
+                        yield from new_studies
+                        fetched += len(new_studies)
+                        logger.info(f"Added {len(new_studies)} studies from page {page_count}")
+                    
+                    # Progress update every 10 pages
+                    if page_count % 10 == 0:
+                        logger.info(f"Progress: {fetched:,} studies fetched in {page_count} pages")
+            finally:
+                # Drop any prefetched page we no longer need
+                executor.shutdown(wait=False, cancel_futures=True)
             
-            if page_count >= max_pages and result.get("nextPageToken"):
+            if page_count >= max_pages and token:
                 logger.warning(f"Reached page limit ({max_pages}), stopping pagination")
-                logger.warning(f"Fetched {len(all_studies):,} studies")
+                logger.warning(f"Fetched {fetched:,} studies")
                 logger.warning("Increase max_pages limit or add filters to get all data")
             
-            total_fetched = len(all_studies)
-            if max_studies and total_fetched >= max_studies:
-                logger.info(f"Data fetch complete: {total_fetched:,} studies fetched (limited by max_studies={max_studies:,})")
+            if max_studies and fetched >= max_studies:
+                logger.info(f"Data fetch complete: {fetched:,} studies fetched (limited by max_studies={max_studies:,})")
             else:
-                logger.info(f"Data fetch complete: {total_fetched:,} studies fetched in {page_count} pages")
-            
-            return all_studies
+                logger.info(f"Data fetch complete: {fetched:,} studies fetched in {page_count} pages")
             
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {e}")
@@ -313,18 +484,27 @@ class ClinicalTrialsAdapter:
             if hasattr(e, 'response') and e.response:
                 logger.error(f"Response status: {e.response.status_code}")
                 logger.error(f"Response text: {e.response.text[:500]}...")
-            return []
+            logger.error(f"Stopping after {fetched:,} studies")
         except Exception as e:
             logger.error(f"Error processing API response: {e}")
             import traceback
             traceback.print_exc()
-            return []
+            logger.error(f"Stopping after {fetched:,} studies")
 
-    def _preprocess(self):
+    def _preprocess(self, studies, workers: Optional[int] = None):
         """
         Preprocess raw API results into node and edge types.
+
+        Args:
+            studies: Iterable of studies (raw API results); consumed once.
+            workers: Number of worker processes to preprocess chunks of
+                studies in; studies are processed in-process when unset.
         """
 
+        # Node tables are dicts keyed by node ID so repeated sponsors,
+        # locations etc. collapse as they are seen (outcomes and diseases
+        # also merge on repeat). Collecting per-occurrence columns and
+        # deduplicating afterwards would hold every repeat until the end.
         self._organisations = {}
         self._sponsors = {}
         self._outcomes = {}
@@ -332,34 +512,110 @@ class ClinicalTrialsAdapter:
         self._diseases = {}
         self._locations = {}
 
-        self._study_to_drug_edges = []
-        self._study_to_disease_edges = []
-        self._study_to_location_edges = []
-        self._study_to_sponsor_edges = []
-        self._study_to_outcome_edges = []
+        # (nctId, props) per study; the raw study documents are not kept
+        self._study_nodes = []
+
+        # Edges are kept as parallel columns of their varying parts; edge
+        # tuples, property dicts and IDs are only built in get_edges.
+        self._study_to_drug_edges = {"source": [], "target": [], "description": []}
+        self._study_to_disease_edges = {"source": [], "target": []}
+        self._study_to_location_edges = {"source": [], "target": []}
+        self._study_to_sponsor_edges = {"source": [], "target": []}
+        self._study_to_outcome_edges = {
+            "source": [],
+            "target": [],
+            "primary": [],
+            "time_frame": [],
+            "description": [],
+        }
+
+        if workers and workers > 1:
+            self._preprocess_parallel(studies, workers)
+        else:
+            for study in studies:
+                self._preprocess_study(study)
+
+    def _preprocess_parallel(self, studies, workers: int):
+        """
+        Preprocess chunks of studies in a process pool and merge the
+        partial tables back in submission order, so first-seen node
+        properties and edge order match the serial path. Only a bounded
+        number of chunks is in flight to keep the study stream lazy.
+
+        Args:
+            studies: Iterable of studies (raw API results); consumed once.
+            workers: Number of worker processes.
+        """
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in _iter_chunks(studies, PREPROCESS_CHUNK_SIZE):
+                pending.append(
+                    executor.submit(
+                        _preprocess_chunk, self.node_types, self.node_fields, chunk
+                    )
+                )
+                if len(pending) >= 2 * workers:
+                    self._merge_tables(pending.popleft().result())
+            while pending:
+                self._merge_tables(pending.popleft().result())
+
+    def _merge_tables(self, tables: dict):
+        """
+        Merge tables preprocessed by a worker into this adapter's tables,
+        applying the same rules as repeated studies in _preprocess_study.
+
+        Args:
+            tables: Table attribute name -> table, from _preprocess_chunk.
+        """
+        for attr in ("_organisations", "_sponsors", "_interventions", "_locations"):
+            merged = getattr(self, attr)
+            for key, value in tables[attr].items():
+                merged.setdefault(key, value)
+
+        for normalized_id, props in tables["_diseases"].items():
+            existing = self._diseases.get(normalized_id)
+            if existing is None:
+                self._diseases[normalized_id] = props
+            else:
+                existing["keywords"].update(props["keywords"])
+
+        for measure, record in tables["_outcomes"].items():
+            existing = self._outcomes.get(measure)
+            if existing is None:
+                self._outcomes[measure] = record
+            else:
+                self._outcomes[measure] = _merge_outcome(
+                    existing, record.primary, record.time_frame, record.description
+                )
 
-        for study in self._studies:
-            self._preprocess_study(study)
+        self._study_nodes.extend(tables["_study_nodes"])
+
+        for attr in _EDGE_TABLES:
+            merged = getattr(self, attr)
+            for column, values in tables[attr].items():
+                merged[column].extend(values)
 
     def _preprocess_study(self, study: dict):
-        if not study.get("protocolSection"):
+        protocol = study.get("protocolSection")
+        if not protocol:
             return
 
-        try:
-            _id = (
-                study.get("protocolSection")
-                .get("identificationModule")
-                .get("nctId")
-            )
-        except AttributeError:
-            _id = None
+        # bind each module once; `or {}` covers both missing and null modules
+        ident = protocol.get("identificationModule") or {}
+        sponsors_mod = protocol.get("sponsorCollaboratorsModule") or {}
+        outcomes_mod = protocol.get("outcomesModule") or {}
+        arms = protocol.get("armsInterventionsModule") or {}
+        conditions_mod = protocol.get("conditionsModule") or {}
+        locs_mod = protocol.get("contactsLocationsModule") or {}
+
+        _id = ident.get("nctId")
 
         if not _id:
             return
 
-        study["nctId"] = _id
+        if self._has_study:
+            self._study_nodes.append((_id, self._get_study_props_from_fields(study)))
 
-        protocol = study.get("protocolSection")
         # the derived module has interesting info about conditions and
         # interventions, linking to MeSH terms; could use for diseases and
         # drugs
@@ -369,85 +625,42 @@ class ClinicalTrialsAdapter:
         oclass = None
 
         # organisations
-        if ClinicalTrialsAdapterNodeType.ORGANISATION in self.node_types:
-            try:
-                name = (
-                    protocol.get("identificationModule")
-                    .get("organization")
-                    .get("fullName")
-                )
-            except AttributeError:
-                name = None
-
-            try:
-                oclass = (
-                    protocol.get("identificationModule")
-                    .get("organization")
-                    .get("class")
-                )
-            except AttributeError:
-                oclass = None
+        if self._has_org:
+            organization = ident.get("organization") or {}
+            name = organization.get("fullName")
+            oclass = organization.get("class")
 
             if name:
                 if name not in self._organisations:
-                    self._organisations.update(
-                        {
-                            name: {"class": oclass or "N/A"},
-                        }
-                    )
+                    self._organisations[name] = {"class": oclass or "N/A"}
 
         # sponsor
-        if ClinicalTrialsAdapterNodeType.SPONSOR in self.node_types:
-            try:
-                lead = protocol.get("sponsorCollaboratorsModule").get(
-                    "leadSponsor"
-                )
-            except AttributeError:
-                lead = None
+        if self._has_sponsor:
+            lead = sponsors_mod.get("leadSponsor")
 
             if lead:
                 name = lead.get("name")
                 
-                # Normalize Unicode characters to avoid encoding issues
+                # Normalize Unicode characters to avoid encoding issues;
+                # interned so repeated names share one object in the edge
+                # columns
                 if name:
-                    name = normalize_unicode(name)
+                    name = sys.intern(normalize_unicode(name))
 
-                if name not in self._sponsors.keys():
-                    self._sponsors.update(
-                        {
-                            name: {
-                                "class": lead.get("class"),
-                            }
-                        }
-                    )
+                if name not in self._sponsors:
+                    self._sponsors[name] = {
+                        "class": lead.get("class"),
+                        "data_source": DATA_SOURCE,
+                    }
 
                 # study to sponsor edges
-                edge_properties = {"data_source": "ClinicalTrials.gov"}
-                edge_id = self._generate_edge_id(_id, name, "study_has_sponsor", edge_properties)
-                
-                self._study_to_sponsor_edges.append(
-                    (
-                        edge_id,
-                        _id,
-                        name,
-                        "study_has_sponsor",
-                        edge_properties,
-                    )
-                )
+                self._study_to_sponsor_edges["source"].append(_id)
+                self._study_to_sponsor_edges["target"].append(name)
 
         # outcomes
-        if ClinicalTrialsAdapterNodeType.OUTCOME in self.node_types:
-            try:
-                primary = protocol.get("outcomesModule").get("primaryOutcomes")
-            except AttributeError:
-                primary = None
-
-            try:
-                secondary = protocol.get("outcomesModule").get(
-                    "secondaryOutcomes"
-                )
-            except AttributeError:
-                secondary = None
+        if self._has_outcome:
+            primary = outcomes_mod.get("primaryOutcomes")
+            secondary = outcomes_mod.get("secondaryOutcomes")
 
             if primary:
                 for outcome in primary:
@@ -458,13 +671,8 @@ class ClinicalTrialsAdapter:
                     self._add_outcome(outcome, False, _id)
 
         # drugs
-        if ClinicalTrialsAdapterNodeType.DRUG in self.node_types:
-            try:
-                interventions = protocol.get("armsInterventionsModule").get(
-                    "interventions"
-                )
-            except AttributeError:
-                interventions = None
+        if self._has_drug:
+            interventions = arms.get("interventions")
 
             if interventions:
                 for intervention in interventions:
@@ -472,7 +680,7 @@ class ClinicalTrialsAdapter:
                         name = intervention.get("name")
                         # Normalize Unicode characters to avoid encoding issues
                         if name:
-                            name = normalize_unicode(name)
+                            name = sys.intern(normalize_unicode(name))
                     except AttributeError:
                         name = None
 
@@ -484,9 +692,7 @@ class ClinicalTrialsAdapter:
                     try:
                         description = intervention.get("description")
                         if description:
-                            description = normalize_unicode(description)
-                            description = replace_quote(description)
-                            description = replace_newline(description)
+                            description = clean_text(description, newlines=True)
                     except AttributeError:
                         description = None
 
@@ -498,94 +704,55 @@ class ClinicalTrialsAdapter:
                         mapped_names = None
 
                     if name:
-                        if name not in self._interventions.keys():
-                            self._interventions.update(
-                                {
-                                    name: {
-                                        "type": intervention_type or "N/A",
-                                        "description": description or "N/A",
-                                        "mapped_names": mapped_names or "N/A",
-                                    },
-                                }
+                        if name not in self._interventions:
+                            self._interventions[name] = _InterventionRecord(
+                                intervention_type or "N/A",
+                                description or "N/A",
+                                mapped_names or "N/A",
                             )
 
                         # study to drug edges
-                        if str(intervention_type).lower() == "drug":
-                            edge_properties = {
-                                "description": description or "N/A",
-                                "data_source": "ClinicalTrials.gov"
-                            }
-                            edge_id = self._generate_edge_id(_id, name, "study_has_drug", edge_properties)
-                            
-                            self._study_to_drug_edges.append(
-                                (
-                                    edge_id,
-                                    _id,
-                                    name,
-                                    "study_has_drug",
-                                    edge_properties,
-                                )
-                            )
+                        if intervention_type and intervention_type.lower() == "drug":
+                            self._study_to_drug_edges["source"].append(_id)
+                            self._study_to_drug_edges["target"].append(name)
+                            self._study_to_drug_edges["description"].append(description or "N/A")
 
         # diseases
-        if ClinicalTrialsAdapterNodeType.DISEASE in self.node_types:
-            try:
-                conditions = protocol.get("conditionsModule").get("conditions")
-            except AttributeError:
-                conditions = None
-
-            try:
-                keywords = protocol.get("conditionsModule").get("keywords")
-            except AttributeError:
-                keywords = []
+        if self._has_disease:
+            conditions = conditions_mod.get("conditions")
+            keywords = conditions_mod.get("keywords")
 
             if conditions:
                 for condition in conditions:
                     # Use condition name as ID (simple replacement for normalize_disease_id)
-                    normalized_id = condition.strip().replace(" ", "_").replace("-", "_").upper() if condition else None
+                    normalized_id = sys.intern(condition.strip().translate(_DISEASE_ID_TABLE).upper()) if condition else None
                     
                     if normalized_id:  # Only process if we have a valid condition
-                        if normalized_id not in self._diseases.keys():
+                        if normalized_id not in self._diseases:
                             self._diseases[normalized_id] = {
                                 "name": condition,  # Keep original name
                                 "original_id": condition,  # Store original as separate property
-                                "keywords": keywords if keywords else []
+                                # kept as an ordered set (dict keys) while
+                                # merging; listed in get_nodes
+                                "keywords": dict.fromkeys(keywords or ()),
+                                "id": normalized_id,  # Ensure ID is set
+                                "data_source": DATA_SOURCE,
                             }
-                        else:
+                        elif keywords:
                             # Merge keywords if disease already exists
-                            if keywords:
-                                existing_keywords = self._diseases[normalized_id].get("keywords", [])
-                                if existing_keywords:
-                                    # Extend with new keywords, avoiding duplicates
-                                    combined_keywords = list(set(existing_keywords + keywords))
-                                    self._diseases[normalized_id]["keywords"] = combined_keywords
-                                else:
-                                    self._diseases[normalized_id]["keywords"] = keywords
+                            self._diseases[normalized_id]["keywords"].update(dict.fromkeys(keywords))
 
                         # study to disease edges (use normalized ID)
-                        edge_properties = {"data_source": "ClinicalTrials.gov"}
-                        edge_id = self._generate_edge_id(_id, normalized_id, "study_has_disease", edge_properties)
-                        
-                        self._study_to_disease_edges.append(
-                            (
-                                edge_id,
-                                _id,
-                                normalized_id,  # Use normalized ID for edge target
-                                "study_has_disease",
-                                edge_properties,
-                            )
-                        )
+                        self._study_to_disease_edges["source"].append(_id)
+                        self._study_to_disease_edges["target"].append(normalized_id)
 
         # locations
-        if ClinicalTrialsAdapterNodeType.LOCATION in self.node_types:
-            if not protocol.get("contactsLocationsModule"):
+        if self._has_location:
+            locations = locs_mod.get("locations")
+            if not locations:
                 return  # only works in last position of flow?
-            if not protocol.get("contactsLocationsModule").get("locations"):
-                return
 
-            for location in protocol.get("contactsLocationsModule").get(
-                "locations"
-            ):
+            for location in locations:
                 try:
                     facility = location.get("facility")
                     city = location.get("city") 
@@ -593,11 +760,11 @@ class ClinicalTrialsAdapter:
                     
                     # Normalize Unicode characters and apply other cleaning
                     if facility:
-                        facility = normalize_unicode(replace_quote(facility))
+                        facility = clean_text(facility)
                     if city:
-                        city = normalize_unicode(replace_quote(city))
+                        city = clean_text(city)
                     if country:
-                        country = normalize_unicode(replace_quote(country))
+                        country = clean_text(country)
                     
                     name = ", ".join([
                         facility or "",
@@ -612,45 +779,33 @@ class ClinicalTrialsAdapter:
 
                 # Individual field processing for backward compatibility
                 try:
-                    city = normalize_unicode(replace_quote(location.get("city"))) if location.get("city") else None
+                    city = clean_text(location.get("city")) or None
                 except AttributeError:
                     city = None
 
                 try:
-                    state = normalize_unicode(replace_quote(location.get("state"))) if location.get("state") else None
+                    state = clean_text(location.get("state")) or None
                 except AttributeError:
                     state = None
 
                 try:
-                    country = normalize_unicode(replace_quote(location.get("country"))) if location.get("country") else None
+                    country = clean_text(location.get("country")) or None
                 except AttributeError:
                     country = None
 
                 if name:
-                    if name not in self._locations.keys():
-                        self._locations.update(
-                            {
-                                name: {
-                                    "city": city or "N/A",
-                                    "state": state or "N/A",
-                                    "country": country or "N/A",
-                                },
-                            }
+                    name = sys.intern(name)
+                    if name not in self._locations:
+                        # states and countries repeat across locations
+                        self._locations[name] = _LocationRecord(
+                            city or "N/A",
+                            sys.intern(state) if state else "N/A",
+                            sys.intern(country) if country else "N/A",
                         )
 
                     # study to location edges
-                    edge_properties = {"data_source": "ClinicalTrials.gov"}
-                    edge_id = self._generate_edge_id(_id, name, "study_has_location", edge_properties)
-                    
-                    self._study_to_location_edges.append(
-                        (
-                            edge_id,
-                            _id,
-                            name,
-                            "study_has_location",
-                            edge_properties,
-                        )
-                    )
+                    self._study_to_location_edges["source"].append(_id)
+                    self._study_to_location_edges["target"].append(name)
 
     def _add_outcome(self, outcome: dict, primary: bool, study_id: str):
         try:
@@ -661,6 +816,10 @@ class ClinicalTrialsAdapter:
 
         try:
             time_frame = outcome.get("timeFrame")
+            # few distinct time frames ("12 months" etc.) recur across
+            # every outcome edge, so share one object per value
+            if time_frame:
+                time_frame = sys.intern(time_frame)
         except AttributeError:
             time_frame = None
 
@@ -671,44 +830,29 @@ class ClinicalTrialsAdapter:
             description = None
 
         if measure:
+            measure = sys.intern(measure)
+
             # Handle outcome node creation/updating
-            if measure not in self._outcomes:
+            existing = self._outcomes.get(measure)
+            if existing is None:
                 # First time seeing this outcome measure
-                self._outcomes[measure] = {
-                    "primary": primary,
-                    "time_frame": time_frame or "N/A",
-                    "description": description or "N/A",
-                }
+                self._outcomes[measure] = _OutcomeRecord(
+                    primary,
+                    time_frame or "N/A",
+                    description or "N/A",
+                )
             else:
-                # Outcome already exists - update if this instance is primary
-                # (prioritize primary outcomes over secondary ones)
-                if primary and not self._outcomes[measure]["primary"]:
-                    self._outcomes[measure]["primary"] = True
-                
-                # Update description and time_frame if current ones are "N/A" and we have better data
-                if self._outcomes[measure]["description"] == "N/A" and description:
-                    self._outcomes[measure]["description"] = description
-                if self._outcomes[measure]["time_frame"] == "N/A" and time_frame:
-                    self._outcomes[measure]["time_frame"] = time_frame
+                self._outcomes[measure] = _merge_outcome(
+                    existing, primary, time_frame, description
+                )
             
             # Always create study to outcome edge
-            edge_properties = {
-                "primary": primary,
-                "time_frame": time_frame or "N/A",
-                "description": description or "N/A",
-                "data_source": "ClinicalTrials.gov"
-            }
-            edge_id = self._generate_edge_id(study_id, measure, "study_has_outcome", edge_properties)
-            
-            self._study_to_outcome_edges.append(
-                (
-                    edge_id,
-                    study_id,
-                    measure,
-                    "study_has_outcome",
-                    edge_properties,
-                )
-            )
+            edges = self._study_to_outcome_edges
+            edges["source"].append(study_id)
+            edges["target"].append(measure)
+            edges["primary"].append(primary)
+            edges["time_frame"].append(time_frame or "N/A")
+            edges["description"].append(description or "N/A")
 
     def get_nodes(self):
         """
@@ -719,53 +863,44 @@ class ClinicalTrialsAdapter:
         logger.info("Generating nodes.")
 
         if ClinicalTrialsAdapterNodeType.STUDY in self.node_types:
-            for study in self._studies:
-                if not study.get("nctId"):
-                    continue
+            for _id, _props in self._study_nodes:
+                _props['data_source'] = DATA_SOURCE
 
-                _props = self._get_study_props_from_fields(study)
-                _props['data_source'] = 'ClinicalTrials.gov'
-
-                yield (study.get("nctId"), "study", _props)
+                yield (_id, "study", _props)
 
         # if ClinicalTrialsAdapterNodeType.ORGANISATION in self.node_types:
         #     for name, props in self._organisations.items():
         #         yield (name, "organisation", props)
 
         if ClinicalTrialsAdapterNodeType.SPONSOR in self.node_types:
+            # each sponsor owns its props dict (data_source is set when it
+            # is created), so it is yielded as-is like the study props
             for name, props in self._sponsors.items():
-                # Create a copy of props to avoid modifying the original
-                node_props = props.copy()
-                node_props['data_source'] = 'ClinicalTrials.gov'
-                yield (name, "sponsor", node_props)
+                yield (name, "sponsor", props)
 
         if ClinicalTrialsAdapterNodeType.OUTCOME in self.node_types:
-            for measure, props in self._outcomes.items():
-                # Create a copy of props to avoid modifying the original
-                node_props = props.copy()
-                node_props['data_source'] = 'ClinicalTrials.gov'
+            for measure, record in self._outcomes.items():
+                node_props = record._asdict()
+                node_props['data_source'] = DATA_SOURCE
                 yield (measure, "outcome", node_props)
 
         if ClinicalTrialsAdapterNodeType.DRUG in self.node_types:
-            for name, props in self._interventions.items():
-                # Create a copy of props to avoid modifying the original
-                node_props = props.copy()
-                node_props['data_source'] = 'ClinicalTrials.gov'
+            for name, record in self._interventions.items():
+                node_props = record._asdict()
+                node_props['data_source'] = DATA_SOURCE
                 yield (name, "drug", node_props)
 
         if ClinicalTrialsAdapterNodeType.DISEASE in self.node_types:
             for normalized_id, props in self._diseases.items():
-                # Create a copy of props to avoid modifying the original
-                node_props = props.copy()
-                node_props['data_source'] = 'ClinicalTrials.gov'
-                node_props['id'] = normalized_id  # Ensure ID is set
-                yield (normalized_id, "disease", node_props)
+                # keywords are merged as an ordered set during preprocessing,
+                # so they keep first-seen order
+                props['keywords'] = list(props['keywords'])
+                yield (normalized_id, "disease", props)
 
         if ClinicalTrialsAdapterNodeType.LOCATION in self.node_types:
-            for name, props in self._locations.items():
-                # Create a copy of props to avoid modifying the original
-                node_props = props.copy()
-                node_props['data_source'] = 'ClinicalTrials.gov'
+            for name, record in self._locations.items():
+                node_props = record._asdict()
+                node_props['data_source'] = DATA_SOURCE
                 yield (name, "location", node_props)
 
     def _get_study_props_from_fields(self, study):
@@ -781,28 +916,22 @@ class ClinicalTrialsAdapter:
         """
 
         props = {}
+        protocol = study.get("protocolSection")
 
-        for field in self.node_fields:
-            if field not in ClinicalTrialsAdapterStudyField:
-                continue
-
-            if field == ClinicalTrialsAdapterStudyField.ID:
-                continue
-
-            path = field.value.split("/")
-            value = study.get("protocolSection")
-
-            if value:
-                for step in path:
-                    if value:
-                        value = value.get(step)
+        for name, path in self._study_field_paths:
+            value = protocol
+            for step in path:
+                if not value:
+                    break
+                value = value.get(step)
 
+            # replace_quote inlined; this runs for every field of every study
             if isinstance(value, list):
-                value = [replace_quote(v) for v in value]
+                value = [v.replace('"', "'") for v in value]
             elif isinstance(value, str):
-                value = replace_quote(value)
+                value = value.replace('"', "'")
 
-            props.update({field.name.lower(): value or "N/A"})
+            props[name] = value or "N/A"
 
         return props
 
@@ -815,19 +944,60 @@ class ClinicalTrialsAdapter:
         logger.info("Generating edges.")
 
         if ClinicalTrialsAdapterEdgeType.STUDY_TO_DRUG in self.edge_types:
-            yield from self._study_to_drug_edges
+            edges = self._study_to_drug_edges
+            for source, target, description in zip(
+                edges["source"], edges["target"], edges["description"]
+            ):
+                edge_properties = {
+                    "description": description,
+                    "data_source": DATA_SOURCE
+                }
+                edge_id = _drug_edge_id(source, target, description)
+                yield (edge_id, source, target, "study_has_drug", edge_properties)
 
         if ClinicalTrialsAdapterEdgeType.STUDY_TO_DISEASE in self.edge_types:
-            yield from self._study_to_disease_edges
+            yield from self._iter_simple_edges(self._study_to_disease_edges, "study_has_disease")
 
         if ClinicalTrialsAdapterEdgeType.STUDY_TO_LOCATION in self.edge_types:
-            yield from self._study_to_location_edges
+            yield from self._iter_simple_edges(self._study_to_location_edges, "study_has_location")
 
         if ClinicalTrialsAdapterEdgeType.STUDY_TO_SPONSOR in self.edge_types:
-            yield from self._study_to_sponsor_edges
+            yield from self._iter_simple_edges(self._study_to_sponsor_edges, "study_has_sponsor")
 
         if ClinicalTrialsAdapterEdgeType.STUDY_TO_OUTCOME in self.edge_types:
-            yield from self._study_to_outcome_edges
+            edges = self._study_to_outcome_edges
+            for source, target, primary, time_frame, description in zip(
+                edges["source"],
+                edges["target"],
+                edges["primary"],
+                edges["time_frame"],
+                edges["description"],
+            ):
+                edge_properties = {
+                    "primary": primary,
+                    "time_frame": time_frame,
+                    "description": description,
+                    "data_source": DATA_SOURCE
+                }
+                edge_id = _outcome_edge_id(source, target, primary, description)
+                yield (edge_id, source, target, "study_has_outcome", edge_properties)
+
+    def _iter_simple_edges(self, edges, edge_type):
+        """
+        Build edge tuples for an edge type whose only property is the data
+        source.
+
+        Args:
+            edges: Column dict with "source" and "target" lists.
+            edge_type: Label of the edges.
+
+        Yields:
+            Edge tuples.
+        """
+        for source, target in zip(edges["source"], edges["target"]):
+            edge_properties = {"data_source": DATA_SOURCE}
+            edge_id = _edge_id(source, target, edge_type, ())
+            yield (edge_id, source, target, edge_type, edge_properties)
 
     def _set_types_and_fields(
         self, node_types, node_fields, edge_types, edge_fields
@@ -837,6 +1007,15 @@ class ClinicalTrialsAdapter:
         else:
             self.node_types = [type for type in ClinicalTrialsAdapterNodeType]
 
+        # membership flags checked once per study in _preprocess_study
+        self._has_study = ClinicalTrialsAdapterNodeType.STUDY in self.node_types
+        self._has_org = ClinicalTrialsAdapterNodeType.ORGANISATION in self.node_types
+        self._has_sponsor = ClinicalTrialsAdapterNodeType.SPONSOR in self.node_types
+        self._has_outcome = ClinicalTrialsAdapterNodeType.OUTCOME in self.node_types
+        self._has_drug = ClinicalTrialsAdapterNodeType.DRUG in self.node_types
+        self._has_disease = ClinicalTrialsAdapterNodeType.DISEASE in self.node_types
+        self._has_location = ClinicalTrialsAdapterNodeType.LOCATION in self.node_types
+
         if node_fields:
             self.node_fields = node_fields
         else:
@@ -848,6 +1027,15 @@ class ClinicalTrialsAdapter:
                 )
             ]
 
+        # (property name, path within protocolSection) per selected study
+        # field, resolved once instead of per study
+        self._study_field_paths = [
+            (field.name.lower(), tuple(field.value.split("/")))
+            for field in self.node_fields
+            if isinstance(field, ClinicalTrialsAdapterStudyField)
+            and field != ClinicalTrialsAdapterStudyField.ID
+        ]
+
         if edge_types:
             self.edge_types = edge_types
         else:
@@ -859,7 +1047,88 @@ class ClinicalTrialsAdapter:
             self.edge_fields = [field for field in chain()]
 
 
+def _merge_outcome(existing, primary, time_frame, description):
+    """
+    Merge a repeated outcome into its existing record: upgrade to primary if
+    this instance is primary, and fill in description/time_frame still "N/A".
+    """
+    updates = {}
+    if primary and not existing.primary:
+        updates["primary"] = True
+    if existing.description == "N/A" and description:
+        updates["description"] = description
+    if existing.time_frame == "N/A" and time_frame:
+        updates["time_frame"] = time_frame
+    return existing._replace(**updates) if updates else existing
+
+
+def _iter_chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _preprocess_chunk(node_types, node_fields, studies):
+    """
+    Process pool task: preprocess a chunk of studies in a fresh adapter
+    (without fetching anything) and return its tables for merging.
+    """
+    adapter = ClinicalTrialsAdapter.__new__(ClinicalTrialsAdapter)
+    adapter._set_types_and_fields(node_types, node_fields, None, None)
+    adapter._preprocess(studies)
+    return {
+        attr: getattr(adapter, attr)
+        for attr in (
+            "_organisations",
+            "_sponsors",
+            "_outcomes",
+            "_interventions",
+            "_diseases",
+            "_locations",
+            "_study_nodes",
+            *_EDGE_TABLES,
+        )
+    }
+
+
+def _edge_id(source_id, target_id, edge_type, extra):
+    """
+    Hash the identifying components of an edge into a readable edge ID.
+    """
+    id_string = "|".join(map(str, (source_id, target_id, edge_type, *extra)))
+    # xxh3 is a non-cryptographic hash, much cheaper than md5 for short keys;
+    # the one-shot hexdigest skips creating a hasher object per edge
+    edge_hash = xxhash.xxh3_64_hexdigest(id_string.encode())[:12]  # Use first 12 chars
+
+    return f"{edge_type}_{edge_hash}"
+
+
+# Edge IDs hash source, target and edge type plus the properties that tell
+# parallel edges apart: the primary flag for outcomes and the first 50
+# characters of the description when it is not "N/A". Each edge type has a
+# fixed property schema, so the ID components are assembled per type.
+
+def _drug_edge_id(source_id, target_id, description):
+    extra = (description[:50],) if description != "N/A" else ()
+    return _edge_id(source_id, target_id, "study_has_drug", extra)
+
+
+def _outcome_edge_id(source_id, target_id, primary, description):
+    if description != "N/A":
+        extra = (f"primary_{primary}", description[:50])
+    else:
+        extra = (f"primary_{primary}",)
+    return _edge_id(source_id, target_id, "study_has_outcome", extra)
+
+
 def replace_quote(string):
+    # a single-character str.replace is a memchr scan that returns the input
+    # itself when there is nothing to replace; translate() is much slower
+    # here, so tables are only used where several replacements combine
+    # (see clean_text)
     return string.replace('"', "'")
 
 
@@ -874,73 +1143,60 @@ def normalize_unicode(string):
     if not string:
         return string
     
-    # Common Unicode character mappings
-    unicode_map = {
-        # Basic Latin accented characters
-        'á': 'a', 'à': 'a', 'ä': 'a', 'â': 'a', 'ã': 'a', 'å': 'a',
-        'é': 'e', 'è': 'e', 'ë': 'e', 'ê': 'e',
-        'í': 'i', 'ì': 'i', 'ï': 'i', 'î': 'i',
-        'ó': 'o', 'ò': 'o', 'ö': 'o', 'ô': 'o', 'õ': 'o',
-        'ú': 'u', 'ù': 'u', 'ü': 'u', 'û': 'u',
-        'ñ': 'n', 'ç': 'c',
-        'Á': 'A', 'À': 'A', 'Ä': 'A', 'Â': 'A', 'Ã': 'A', 'Å': 'A',
-        'É': 'E', 'È': 'E', 'Ë': 'E', 'Ê': 'E',
-        'Í': 'I', 'Ì': 'I', 'Ï': 'I', 'Î': 'I',
-        'Ó': 'O', 'Ò': 'O', 'Ö': 'O', 'Ô': 'O', 'Õ': 'O',
-        'Ú': 'U', 'Ù': 'U', 'Ü': 'U', 'Û': 'U',
-        'Ñ': 'N', 'Ç': 'C',
-        
-        # Extended Latin characters (Turkish, Polish, etc.)
-        'ş': 's', 'Ş': 'S',  # Turkish s with cedilla
-        'ğ': 'g', 'Ğ': 'G',  # Turkish g with breve
-        'ı': 'i', 'İ': 'I',  # Turkish dotless i / i with dot
-        'ž': 'z', 'Ž': 'Z',  # z with caron
-        'ł': 'l', 'Ł': 'L',  # Polish l with stroke
-        'ć': 'c', 'Ć': 'C',  # c with acute
-        'ś': 's', 'Ś': 'S',  # s with acute
-        'ź': 'z', 'Ź': 'Z',  # z with acute
-        'ż': 'z', 'Ż': 'Z',  # z with dot above
-        'ń': 'n', 'Ń': 'N',  # n with acute
-        'ř': 'r', 'Ř': 'R',  # r with caron
-        'š': 's', 'Š': 'S',  # s with caron
-        'č': 'c', 'Č': 'C',  # c with caron
-        'ď': 'd', 'Ď': 'D',  # d with caron
-        'ť': 't', 'Ť': 'T',  # t with caron
-        'ň': 'n', 'Ň': 'N',  # n with caron
-        'ů': 'u', 'Ů': 'U',  # u with ring above
-        'ē': 'e', 'Ē': 'E',  # e with macron
-        'ī': 'i', 'Ī': 'I',  # i with macron
-        'ā': 'a', 'Ā': 'A',  # a with macron
-        'ō': 'o', 'Ō': 'O',  # o with macron
-        'ū': 'u', 'Ū': 'U',  # u with macron
-        
-        # Special symbols and punctuation
-        '®': '',              # Registered trademark (remove)
-        '™': '',              # Trademark (remove)
-        '©': '',              # Copyright (remove)
-        '•': '-',             # Bullet point -> dash
-        '–': '-',             # En dash -> hyphen
-        '—': '-',             # Em dash -> hyphen
-        ''': "'",             # Left single quotation mark
-        ''': "'",             # Right single quotation mark
-        '"': '"',             # Left double quotation mark
-        '"': '"',             # Right double quotation mark
-        '…': '...',           # Horizontal ellipsis
-        
-        # Chinese/CJK punctuation
-        '，': ',',             # Chinese comma
-        '。': '.',             # Chinese period
-        '（': '(',             # Chinese left parenthesis
-        '）': ')',             # Chinese right parenthesis
-        '：': ':',             # Chinese colon
-        '；': ';',             # Chinese semicolon
-        '？': '?',             # Chinese question mark
-        '！': '!',             # Chinese exclamation mark
-    }
-    
     # Replace Unicode characters with ASCII equivalents
-    normalized = string
-    for unicode_char, ascii_char in unicode_map.items():
-        normalized = normalized.replace(unicode_char, ascii_char)
-    
-    return normalized
\ No newline at end of file
+    normalized = string.translate(_UNICODE_TABLE)
+    if normalized.isascii():
+        return normalized
+
+    return _strip_accents(normalized)
+
+
+def clean_text(string, newlines=False):
+    """
+    Normalize Unicode characters and replace double quotes (and optionally
+    newlines) in a single pass; equivalent to chaining normalize_unicode,
+    replace_quote and replace_newline.
+    """
+    if not string:
+        return string
+
+    table = _CLEAN_NEWLINE_TABLE if newlines else _CLEAN_TABLE
+    cleaned = string.translate(table)
+    if cleaned.isascii():
+        return cleaned
+
+    return _strip_accents(cleaned)
+
+
+def _strip_accents(string):
+    """
+    Drop accents UNICODE_MAP does not cover (e.g. 'ő' -> 'o'): Latin letters
+    are decomposed with NFD and lose their combining diacritical marks
+    (U+0300-U+036F). Every other character, including the marks of non-Latin
+    scripts (dakuten, virama etc.) and compatibility forms such as '²', is
+    left as it was, since these strings become node IDs.
+    """
+    chars = []
+    latin = False
+    for char in string:
+        if unicodedata.category(char).startswith("M"):
+            # Marks attach to the preceding base character
+            if not (latin and "\u0300" <= char <= "\u036f"):
+                chars.append(char)
+            continue
+
+        latin = _is_latin(char)
+        if latin and not char.isascii():
+            decomposed = unicodedata.normalize("NFD", char)
+            if len(decomposed) > 1:
+                char = unicodedata.normalize("NFC", "".join(
+                    c for c in decomposed if not "\u0300" <= c <= "\u036f"
+                ))
+        chars.append(char)
+    return "".join(chars)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_latin(char):
+    """Whether a character is a letter of the Latin script"""
+    return unicodedata.name(char, "").startswith("LATIN ")
@@ -5,11 +5,22 @@ Follows the same pattern as CIViC and other adapters
 
 from . import DgidbBaseAdapter
 import os
-import csv
 import logging
+import pandas as pd
 import requests
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Boolean drug flags, "TRUE"/"FALSE" (any case) in drugs and interactions
+_DRUG_FLAGS = ("approved", "immunotherapy", "anti_neoplastic")
+
+# Name -> ID cleaning: spaces and hyphens become underscores, and drug IDs
+# also drop parentheses
+_GENE_ID_TABLE = str.maketrans({' ': '_', '-': '_'})
+_DRUG_ID_TABLE = str.maketrans({' ': '_', '-': '_', '(': None, ')': None})
+
 class DgidbAdapter(DgidbBaseAdapter):
     """Adapter for DGIdb data with URL-based downloads"""
     
@@ -29,8 +40,8 @@ class DgidbAdapter(DgidbBaseAdapter):
         self.genes = {}          # gene_name -> gene_data
         self.drugs = {}          # drug_name -> drug_data
         self.categories = {}     # category_name -> category_data (category_name is used as ID)
-        self.interactions = []   # list of interaction records
-        self.gene_category_relationships = []  # list of gene-category relationships
+        self.interactions = []   # list of (gene_id, drug_id, interaction_type, interaction_score)
+        self.gene_category_relationships = []  # list of (gene_name, category_name) tuples
 
     def download_data(self, config=None):
         """Download data from DGIdb URLs"""
@@ -50,24 +61,46 @@ class DgidbAdapter(DgidbBaseAdapter):
             self.categories_file: dgidb_config['categories']['url']
         }
         
-        for file_path, url in urls.items():
-            file_name = os.path.basename(file_path).replace('dgidb_', '')
-            self.logger.info(f"Getting DGIdb {file_name} data...")
-            
-            try:
-                response = requests.get(url, timeout=300)
+        # The four files are independent, so fetch them concurrently; any
+        # failure is re-raised here once the other downloads have finished.
+        # One pooled session serves all of them, so connections to the
+        # same host are reused instead of a new TLS handshake per file.
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            futures = [
+                executor.submit(self._download_file, session, file_path, url)
+                for file_path, url in urls.items()
+            ]
+            for future in futures:
+                future.result()
+
+    def _download_file(self, session, file_path, url):
+        """Download a single DGIdb file using the given requests session"""
+        file_name = os.path.basename(file_path).replace('dgidb_', '')
+        self.logger.info(f"Getting DGIdb {file_name} data...")
+        
+        try:
+            # Stream the body straight to disk instead of holding the
+            # whole file (and a decoded copy of it) in memory
+            with session.get(url, timeout=300, stream=True) as response:
                 response.raise_for_status()
                 
                 os.makedirs(os.path.dirname(file_path), exist_ok=True)
                 
-                with open(file_path, "w", encoding='utf-8') as f:
-                    f.write(response.text)
-                
-                self.logger.info(f"✅ {file_name}: {file_path}")
-                
-            except Exception as e:
-                self.logger.error(f"❌ Failed to download {file_name}: {e}")
-                raise
+                # Copy the raw socket stream to disk in 1 MiB blocks,
+                # letting urllib3 undo any gzip/deflate transfer encoding.
+                # Write to a partial file and rename it into place once
+                # complete, so a failed download keeps the previous file
+                response.raw.decode_content = True
+                partial_path = f"{file_path}.part"
+                with open(partial_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+                os.replace(partial_path, file_path)
+            
+            self.logger.info(f"✅ {file_name}: {file_path}")
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to download {file_name}: {e}")
+            raise
 
     def parse_data(self):
         """Parse data from DGIdb TSV files"""
@@ -82,6 +115,21 @@ class DgidbAdapter(DgidbBaseAdapter):
         self.logger.info("DGIdb data parsing complete")
         self._log_statistics()
 
+    def _read_tsv(self, file_path, columns):
+        """
+        Read the given columns of a DGIdb TSV with pandas' C parser, as
+        strings; columns missing from the file are filled with ''.
+        """
+        df = pd.read_csv(
+            file_path,
+            sep='\t',
+            dtype=str,
+            na_filter=False,
+            usecols=lambda column: column in columns,
+            engine='c',
+        )
+        return df.reindex(columns=columns, fill_value="").fillna("")
+
     def _parse_genes(self):
         """Parse genes.tsv file"""
         self.logger.info("Parsing genes...")
@@ -90,28 +138,36 @@ class DgidbAdapter(DgidbBaseAdapter):
             self.logger.warning(f"Genes file not found: {self.genes_file}")
             return
         
-        with open(self.genes_file, "r", encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            for row in reader:
-                # Use gene_name as primary, fallback to gene_claim_name
-                gene_name = row.get("gene_name", "").strip()
-                gene_claim_name = row.get("gene_claim_name", "").strip()
-                
-                if not gene_name or gene_name == 'NULL':
-                    gene_name = gene_claim_name
-                
-                if gene_name and gene_name != 'NULL':
-                    # Clean gene name for ID
-                    gene_id = gene_name.replace(' ', '_').replace('-', '_')
-                    
-                    self.genes[gene_id] = {
-                        "id": gene_id,
-                        "gene_name": gene_name,
-                        "gene_claim_name": gene_claim_name,
-                        "concept_id": row.get("concept_id", ""),
-                        "nomenclature": row.get("nomenclature", ""),
-                        "data_source": "DGIdb"
-                    }
+        df = self._read_tsv(
+            self.genes_file,
+            ["gene_name", "gene_claim_name", "concept_id", "nomenclature"],
+        )
+        
+        # Use gene_name as primary, fallback to gene_claim_name
+        gene_name, gene_claim_name, valid = _names_with_fallback(
+            df["gene_name"], df["gene_claim_name"]
+        )
+        df = df[valid]
+        gene_name = gene_name[valid]
+        
+        # Clean gene name for ID
+        gene_id = gene_name.str.translate(_GENE_ID_TABLE)
+        
+        for row in zip(
+            gene_id.tolist(),
+            gene_name.tolist(),
+            gene_claim_name[valid].tolist(),
+            df["concept_id"].tolist(),
+            map(sys.intern, df["nomenclature"].tolist()),
+        ):
+            self.genes[row[0]] = {
+                "id": row[0],
+                "gene_name": row[1],
+                "gene_claim_name": row[2],
+                "concept_id": row[3],
+                "nomenclature": row[4],
+                "data_source": "DGIdb"
+            }
 
     def _parse_drugs(self):
         """Parse drugs.tsv file"""
@@ -121,31 +177,40 @@ class DgidbAdapter(DgidbBaseAdapter):
             self.logger.warning(f"Drugs file not found: {self.drugs_file}")
             return
         
-        with open(self.drugs_file, "r", encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            for row in reader:
-                # Use drug_name as primary, fallback to drug_claim_name
-                drug_name = row.get("drug_name", "").strip()
-                drug_claim_name = row.get("drug_claim_name", "").strip()
-                
-                if not drug_name or drug_name == 'NULL':
-                    drug_name = drug_claim_name
-                
-                if drug_name and drug_name != 'NULL':
-                    # Clean drug name for ID
-                    drug_id = drug_name.replace(' ', '_').replace('-', '_').replace('(', '').replace(')', '')
-                    
-                    self.drugs[drug_id] = {
-                        "id": drug_id,
-                        "drug_name": drug_name,
-                        "drug_claim_name": drug_claim_name,
-                        "concept_id": row.get("concept_id", ""),
-                        "nomenclature": row.get("nomenclature", ""),
-                        "approved": row.get("approved", "FALSE").upper() == "TRUE",
-                        "immunotherapy": row.get("immunotherapy", "FALSE").upper() == "TRUE",
-                        "anti_neoplastic": row.get("anti_neoplastic", "FALSE").upper() == "TRUE",
-                        "data_source": "DGIdb"
-                    }
+        df = self._read_tsv(
+            self.drugs_file,
+            ["drug_name", "drug_claim_name", "concept_id", "nomenclature", *_DRUG_FLAGS],
+        )
+        
+        # Use drug_name as primary, fallback to drug_claim_name
+        drug_name, drug_claim_name, valid = _names_with_fallback(
+            df["drug_name"], df["drug_claim_name"]
+        )
+        df = df[valid]
+        drug_name = drug_name[valid]
+        
+        # Clean drug name for ID
+        drug_id = drug_name.str.translate(_DRUG_ID_TABLE)
+        
+        for row in zip(
+            drug_id.tolist(),
+            drug_name.tolist(),
+            drug_claim_name[valid].tolist(),
+            df["concept_id"].tolist(),
+            map(sys.intern, df["nomenclature"].tolist()),
+            *_drug_flag_columns(df),
+        ):
+            self.drugs[row[0]] = {
+                "id": row[0],
+                "drug_name": row[1],
+                "drug_claim_name": row[2],
+                "concept_id": row[3],
+                "nomenclature": row[4],
+                "approved": row[5],
+                "immunotherapy": row[6],
+                "anti_neoplastic": row[7],
+                "data_source": "DGIdb"
+            }
 
     def _parse_categories(self):
         """Parse categories.tsv file"""
@@ -158,32 +223,34 @@ class DgidbAdapter(DgidbBaseAdapter):
         # Track gene-category relationships for edge generation
         self.gene_category_relationships = []
         
-        with open(self.categories_file, "r", encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            for row in reader:
-                gene_name = row.get("name", "").strip()
-                category_name = row.get("name-2", "").strip()
-                source_db_name = row.get("source_db_name", "").strip()
-                source_db_version = row.get("source_db_version", "").strip()
-                
-                if gene_name and category_name:
-                    # Store gene-category relationship for edge generation
-                    self.gene_category_relationships.append({
-                        'gene_name': gene_name,
-                        'category_name': category_name
-                    })
-                    
-                    # Create category node (use category name as ID)
-                    category_id = category_name
-                    
-                    if category_id not in self.categories:
-                        self.categories[category_id] = {
-                            "id": category_id,
-                            "name": category_name,  # Category name
-                            "source_db_name": source_db_name,
-                            "source_db_version": source_db_version,
-                            "data_source": "DGIdb"
-                        }
+        df = self._read_tsv(
+            self.categories_file,
+            ["name", "name-2", "source_db_name", "source_db_version"],
+        )
+        gene_name = df["name"].str.strip()
+        category_name = df["name-2"].str.strip()
+        valid = gene_name.ne("") & category_name.ne("")
+        
+        for gene_name, category_name, source_db_name, source_db_version in zip(
+            gene_name[valid].tolist(),
+            category_name[valid].tolist(),
+            map(sys.intern, df["source_db_name"][valid].str.strip().tolist()),
+            map(sys.intern, df["source_db_version"][valid].str.strip().tolist()),
+        ):
+            # Store gene-category relationship for edge generation
+            self.gene_category_relationships.append((gene_name, category_name))
+            
+            # Create category node (use category name as ID)
+            category_id = category_name
+            
+            if category_id not in self.categories:
+                self.categories[category_id] = {
+                    "id": category_id,
+                    "name": category_name,  # Category name
+                    "source_db_name": source_db_name,
+                    "source_db_version": source_db_version,
+                    "data_source": "DGIdb"
+                }
 
     def _parse_interactions(self):
         """Parse interactions.tsv file"""
@@ -193,59 +260,80 @@ class DgidbAdapter(DgidbBaseAdapter):
             self.logger.warning(f"Interactions file not found: {self.interactions_file}")
             return
         
-        with open(self.interactions_file, "r", encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            for row in reader:
-                # Get gene and drug names
-                gene_name = row.get("gene_name", "").strip()
-                gene_claim_name = row.get("gene_claim_name", "").strip()
-                drug_name = row.get("drug_name", "").strip()
-                drug_claim_name = row.get("drug_claim_name", "").strip()
-                
-                # Use primary names, fallback to claim names
-                if not gene_name or gene_name == 'NULL':
-                    gene_name = gene_claim_name
-                if not drug_name or drug_name == 'NULL':
-                    drug_name = drug_claim_name
-                
-                if gene_name and drug_name and gene_name != 'NULL' and drug_name != 'NULL':
-                    # Clean names for IDs
-                    gene_id = gene_name.replace(' ', '_').replace('-', '_')
-                    drug_id = drug_name.replace(' ', '_').replace('-', '_').replace('(', '').replace(')', '')
-                    
-                    # Add to genes/drugs if not already present (from interactions.tsv)
-                    if gene_id not in self.genes:
-                        self.genes[gene_id] = {
-                            "id": gene_id,
-                            "gene_name": gene_name,
-                            "gene_claim_name": gene_claim_name,
-                            "concept_id": row.get("gene_concept_id", ""),
-                            "nomenclature": "",
-                            "data_source": "DGIdb"
-                        }
-                    
-                    if drug_id not in self.drugs:
-                        self.drugs[drug_id] = {
-                            "id": drug_id,
-                            "drug_name": drug_name,
-                            "drug_claim_name": drug_claim_name,
-                            "concept_id": row.get("drug_concept_id", ""),
-                            "nomenclature": "",
-                            "approved": row.get("approved", "FALSE").upper() == "TRUE",
-                            "immunotherapy": row.get("immunotherapy", "FALSE").upper() == "TRUE",
-                            "anti_neoplastic": row.get("anti_neoplastic", "FALSE").upper() == "TRUE",
-                            "data_source": "DGIdb"
-                        }
-                    
-                    # Store interaction
-                    interaction = {
-                        "gene_id": gene_id,
-                        "drug_id": drug_id,
-                        "interaction_type": row.get("interaction_type", ""),
-                        "interaction_score": row.get("interaction_score", "0"),
-                        "data_source": "DGIdb"
-                    }
-                    self.interactions.append(interaction)
+        df = self._read_tsv(
+            self.interactions_file,
+            [
+                "gene_name", "gene_claim_name", "gene_concept_id",
+                "drug_name", "drug_claim_name", "drug_concept_id",
+                "interaction_type", "interaction_score", *_DRUG_FLAGS,
+            ],
+        )
+        
+        # Use primary names, fallback to claim names
+        gene_name, gene_claim_name, gene_valid = _names_with_fallback(
+            df["gene_name"], df["gene_claim_name"]
+        )
+        drug_name, drug_claim_name, drug_valid = _names_with_fallback(
+            df["drug_name"], df["drug_claim_name"]
+        )
+        valid = gene_valid & drug_valid
+        df = df[valid]
+        gene_name = gene_name[valid]
+        drug_name = drug_name[valid]
+        
+        # Clean names for IDs
+        gene_id = gene_name.str.translate(_GENE_ID_TABLE)
+        drug_id = drug_name.str.translate(_DRUG_ID_TABLE)
+        
+        # IDs and interaction types repeat across interaction records, so
+        # they are interned to share one string object per value
+        for (
+            gene_id, drug_id, gene_name, gene_claim_name, gene_concept_id,
+            drug_name, drug_claim_name, drug_concept_id,
+            approved, immunotherapy, anti_neoplastic,
+            interaction_type, interaction_score,
+        ) in zip(
+            map(sys.intern, gene_id.tolist()),
+            map(sys.intern, drug_id.tolist()),
+            gene_name.tolist(),
+            gene_claim_name[valid].tolist(),
+            df["gene_concept_id"].tolist(),
+            drug_name.tolist(),
+            drug_claim_name[valid].tolist(),
+            df["drug_concept_id"].tolist(),
+            *_drug_flag_columns(df),
+            map(sys.intern, df["interaction_type"].tolist()),
+            # Scores as floats; empty or non-numeric scores become 0.0
+            pd.to_numeric(df["interaction_score"], errors="coerce").fillna(0.0).tolist(),
+        ):
+            # Add to genes/drugs if not already present (from interactions.tsv)
+            if gene_id not in self.genes:
+                self.genes[gene_id] = {
+                    "id": gene_id,
+                    "gene_name": gene_name,
+                    "gene_claim_name": gene_claim_name,
+                    "concept_id": gene_concept_id,
+                    "nomenclature": "",
+                    "data_source": "DGIdb"
+                }
+            
+            if drug_id not in self.drugs:
+                self.drugs[drug_id] = {
+                    "id": drug_id,
+                    "drug_name": drug_name,
+                    "drug_claim_name": drug_claim_name,
+                    "concept_id": drug_concept_id,
+                    "nomenclature": "",
+                    "approved": approved,
+                    "immunotherapy": immunotherapy,
+                    "anti_neoplastic": anti_neoplastic,
+                    "data_source": "DGIdb"
+                }
+            
+            # Store interaction
+            self.interactions.append(
+                (gene_id, drug_id, interaction_type, interaction_score)
+            )
 
     def get_nodes(self):
         """Get all nodes for the knowledge graph"""
@@ -267,36 +355,30 @@ class DgidbAdapter(DgidbBaseAdapter):
         edge_counter = 0
         
         # Drug-Gene interaction edges
-        for interaction in self.interactions:
+        for gene_id, drug_id, interaction_type, interaction_score in self.interactions:
             edge_counter += 1
             
-            # Convert interaction_score to float if possible
-            try:
-                score = float(interaction['interaction_score']) if interaction['interaction_score'] else 0.0
-            except (ValueError, TypeError):
-                score = 0.0
-            
             properties = {
-                'interaction_type': interaction['interaction_type'],
-                'interaction_score': score,
-                'data_source': interaction['data_source']
+                'interaction_type': interaction_type,
+                'interaction_score': interaction_score,
+                'data_source': 'DGIdb'
             }
             
             yield (
                 f"dgidb_interaction_{edge_counter}",  # edge_id
-                interaction['drug_id'],               # source: drug
-                interaction['gene_id'],               # target: gene
+                drug_id,                              # source: drug
+                gene_id,                              # target: gene
                 "DRUG_GENE_INTERACTION",
                 properties
             )
         
         # Gene-Category edges (from gene-category relationships)
-        for relationship in self.gene_category_relationships:
-            gene_name = relationship['gene_name']
-            category_name = relationship['category_name']
-            
-            # Check if both gene and category exist in our data
-            if gene_name in self.genes and category_name in self.categories:
+        genes = self.genes
+        categories = self.categories
+        for gene_name, category_name in self.gene_category_relationships:
+            # Check if both gene and category exist in our data (one hash
+            # lookup each, keyed the same way as the node dicts)
+            if gene_name in genes and category_name in categories:
                 edge_counter += 1
                 
                 properties = {
@@ -317,3 +399,21 @@ class DgidbAdapter(DgidbBaseAdapter):
         self.logger.info(f"Parsed {len(self.drugs)} drugs")
         self.logger.info(f"Parsed {len(self.categories)} categories")
         self.logger.info(f"Parsed {len(self.interactions)} interactions")
+
+
+def _names_with_fallback(name, claim_name):
+    """
+    Strip a primary name column and its claim name column, and fall back to
+    the claim name where the primary name is empty or 'NULL'.
+
+    Returns:
+        (names, claim names, mask of rows with a usable name)
+    """
+    name = name.str.strip()
+    claim_name = claim_name.str.strip()
+    name = name.mask(name.eq("") | name.eq("NULL"), claim_name)
+    return name, claim_name, name.ne("") & name.ne("NULL")
+
+
+def _drug_flag_columns(df):
+    return [df[flag].str.upper().eq("TRUE").tolist() for flag in _DRUG_FLAGS]
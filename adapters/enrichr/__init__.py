@@ -5,6 +5,7 @@ Base adapter for Enrichr data
 from ..import KnowledgeGraphAdapter
 import csv
 import logging
+import sys
 
 class EnrichrAdapter(KnowledgeGraphAdapter):
     """Base adapter for Enrichr data"""
@@ -13,29 +14,38 @@ class EnrichrAdapter(KnowledgeGraphAdapter):
         """Initialize the adapter"""
         super().__init__()
         self.file_path = file_path
-        self.data = {}
+        # (term, genes) for each line of the library, in file order
+        self.data = []
         self.logger = logging.getLogger(__name__)
         
         if file_path:
             self.parse_data()
     
     def parse_data(self):
-        """Parse data from file"""
+        """
+        Parse data from file. The subclasses build their nodes and edges
+        from the parsed records only, so a library that can't be read is
+        an error rather than an empty dataset.
+        """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
+            # Gene set libraries are read in one pass; a 1 MiB buffer cuts
+            # the number of read calls on the larger libraries
+            with open(self.file_path, 'r', encoding='utf-8', buffering=1024 * 1024) as f:
                 for line in f:
                     line = line.strip()
-                    if not line or line.startswith('#'):
+                    if not line:
                         continue
                     
                     parts = line.split('\t')
                     if len(parts) >= 1:
                         term = parts[0]
-                        # Filter out empty gene entries
-                        genes = [g.strip() for g in parts[1:] if g.strip()]
-                        self.data[term] = genes
+                        # Filter out empty gene entries; genes recur across
+                        # many terms, so intern them to share one object each
+                        genes = [sys.intern(g) for g in map(str.strip, parts[1:]) if g]
+                        self.data.append((term, genes))
         except Exception as e:
             self.logger.error(f"Error parsing data from {self.file_path}: {e}")
+            raise
     
     def get_nodes(self):
         """Get nodes for the knowledge graph"""
@@ -48,7 +58,7 @@ class EnrichrAdapter(KnowledgeGraphAdapter):
     def get_statistics(self):
         """Get statistics about the data"""
         return {
-            "terms": len(self.data),
-            "genes": len(set(gene for genes in self.data.values() for gene in genes)),
-            "associations": sum(len(genes) for genes in self.data.values())
+            "terms": len(set(term for term, genes in self.data)),
+            "genes": len(set(gene for term, genes in self.data for gene in genes)),
+            "associations": sum(len(genes) for term, genes in self.data)
         }
@@ -5,6 +5,8 @@ Adapter for Gene Ontology Biological Process data from Enrichr
 from . import EnrichrAdapter
 import re
 
+_GO_RE = re.compile(r"(GO:\d+)")
+
 class BiologicalProcessAdapter(EnrichrAdapter):
     """Adapter for Gene Ontology Biological Process data from Enrichr"""
     
@@ -14,32 +16,29 @@ class BiologicalProcessAdapter(EnrichrAdapter):
     
     def get_nodes(self):
         """Get nodes for the knowledge graph"""
-        with open(self.file_path, 'r') as f:
-            for line in f:
-                items = line.strip().split('\t')
-                name = items[0].rsplit(" ", 1)[0].replace("'", "").strip()
-                match = re.search(r"(GO:\d+)", items[0])
-                if match:
-                    pid = match.group(0)
-                    yield (pid, "biological_process", {"name": name, "data_source": "Gene Ontology"})
-                for gene in items[1:]:
-                    gene = gene.strip()
-                    if gene:
-                        yield (gene, "gene", {"data_source": "Gene Ontology"})
+        # Genes recur across many terms; yield each gene node once
+        seen_genes = set()
+        for term, genes in self.data:
+            name = term.rsplit(" ", 1)[0].replace("'", "").strip()
+            match = _GO_RE.search(term)
+            if match:
+                pid = match.group(0)
+                yield (pid, "biological_process", {"name": name, "data_source": "Gene Ontology"})
+            for gene in genes:
+                if gene in seen_genes:
+                    continue
+                seen_genes.add(gene)
+                yield (gene, "gene", {"data_source": "Gene Ontology"})
     
     def get_edges(self):
         """Get edges for the knowledge graph"""
-        with open(self.file_path, 'r') as f:
-            for line in f:
-                items = line.strip().split('\t')
-                name = items[0].rsplit(" ", 1)[0].replace("'", "").strip()
-                match = re.search(r"(GO:\d+)", items[0])
-                if match:
-                    pid = match.group(0)
-                    for gene in items[1:]:
-                        gene = gene.strip()
-                        if gene:
-                            yield (f"interaction-{pid}-{gene}", pid, gene, "involved_in", {
-                                "function_name": name, 
-                                "data_source": "Gene Ontology"
-                            })
+        for term, genes in self.data:
+            name = term.rsplit(" ", 1)[0].replace("'", "").strip()
+            match = _GO_RE.search(term)
+            if match:
+                pid = match.group(0)
+                for gene in genes:
+                    yield (f"interaction-{pid}-{gene}", pid, gene, "involved_in", {
+                        "function_name": name, 
+                        "data_source": "Gene Ontology"
+                    })
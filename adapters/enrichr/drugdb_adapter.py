@@ -13,23 +13,20 @@ class DrugDBAdapter(EnrichrAdapter):
     
     def get_nodes(self):
         """Get nodes for the knowledge graph"""
-        with open(self.file_path, 'r') as f:
-            for line in f:
-                items = line.strip().split('\t')
-                drug = items[0].strip()
-                yield (drug, "drug", {"data_source": "DGIdb"})
-                for gene in items[1:]:
-                    gene = gene.strip()
-                    if gene:
-                        yield (gene, "gene", {"data_source": "DGIdb"})
+        # Genes recur across many terms; yield each gene node once
+        seen_genes = set()
+        for term, genes in self.data:
+            drug = term.strip()
+            yield (drug, "drug", {"data_source": "DGIdb"})
+            for gene in genes:
+                if gene in seen_genes:
+                    continue
+                seen_genes.add(gene)
+                yield (gene, "gene", {"data_source": "DGIdb"})
     
     def get_edges(self):
         """Get edges for the knowledge graph"""
-        with open(self.file_path, 'r') as f:
-            for line in f:
-                items = line.strip().split('\t')
-                drug = items[0].strip()
-                for gene in items[1:]:
-                    gene = gene.strip()
-                    if gene:
-                        yield (f"interaction-{drug}-{gene}", drug, gene, "targets", {"data_source": "DGIdb"})
+        for term, genes in self.data:
+            drug = term.strip()
+            for gene in genes:
+                yield (f"interaction-{drug}-{gene}", drug, gene, "targets", {"data_source": "DGIdb"})
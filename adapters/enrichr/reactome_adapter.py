@@ -5,6 +5,8 @@ Adapter for Reactome pathways from Enrichr
 from . import EnrichrAdapter
 import re
 
+_REACTOME_RE = re.compile(r"(R-HSA-\d+)")
+
 class ReactomeAdapter(EnrichrAdapter):
     """Adapter for Reactome pathways from Enrichr"""
     
@@ -14,32 +16,29 @@ class ReactomeAdapter(EnrichrAdapter):
     
     def get_nodes(self):
         """Get nodes for the knowledge graph"""
-        with open(self.file_path, 'r') as f:
-            for line in f:
-                items = line.strip().split('\t')
-                name = items[0].rsplit(" ", 1)[0].replace("'", "").strip()
-                match = re.search(r"(R-HSA-\d+)", items[0])
-                if match:
-                    pid = match.group(0)
-                    yield (pid, "pathway", {"name": name, "data_source": "Reactome"})
-                for gene in items[1:]:
-                    gene = gene.strip()
-                    if gene:
-                        yield (gene, "gene", {"data_source": "Reactome"})
+        # Genes recur across many terms; yield each gene node once
+        seen_genes = set()
+        for term, genes in self.data:
+            name = term.rsplit(" ", 1)[0].replace("'", "").strip()
+            match = _REACTOME_RE.search(term)
+            if match:
+                pid = match.group(0)
+                yield (pid, "pathway", {"name": name, "data_source": "Reactome"})
+            for gene in genes:
+                if gene in seen_genes:
+                    continue
+                seen_genes.add(gene)
+                yield (gene, "gene", {"data_source": "Reactome"})
     
     def get_edges(self):
         """Get edges for the knowledge graph"""
-        with open(self.file_path, 'r') as f:
-            for line in f:
-                items = line.strip().split('\t')
-                name = items[0].rsplit(" ", 1)[0].replace("'", "").strip()
-                match = re.search(r"(R-HSA-\d+)", items[0])
-                if match:
-                    pid = match.group(0)
-                    for gene in items[1:]:
-                        gene = gene.strip()
-                        if gene:
-                            yield (f"interaction-{pid}-{gene}", pid, gene, "associated_with", {
-                                "pathway_name": name, 
-                                "data_source": "Reactome"
-                            })
+        for term, genes in self.data:
+            name = term.rsplit(" ", 1)[0].replace("'", "").strip()
+            match = _REACTOME_RE.search(term)
+            if match:
+                pid = match.group(0)
+                for gene in genes:
+                    yield (f"interaction-{pid}-{gene}", pid, gene, "associated_with", {
+                        "pathway_name": name, 
+                        "data_source": "Reactome"
+                    })
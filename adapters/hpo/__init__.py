@@ -3,8 +3,16 @@ Base adapter for HPO (Human Phenotype Ontology) data
 """
 
 from ..import KnowledgeGraphAdapter
-import csv
+import hashlib
 import logging
+import os
+import pandas as pd
+import pickle
+import sys
+
+# Version of the parsed-table cache; bump it whenever _parse_tsv changes
+# what it returns, so tables cached by an older parser are not reused
+_CACHE_VERSION = 1
 
 class HPOAdapter(KnowledgeGraphAdapter):
     """Base adapter for HPO data"""
@@ -13,7 +21,6 @@ class HPOAdapter(KnowledgeGraphAdapter):
         """Initialize the adapter"""
         super().__init__()
         self.file_path = file_path
-        self.data = []
         self.logger = logging.getLogger(__name__)
         
         if file_path:
@@ -23,6 +30,80 @@ class HPOAdapter(KnowledgeGraphAdapter):
         """Parse data from file - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement parse_data()")
     
+    def _read_tsv(self, columns):
+        """
+        Read the given columns of the adapter's TSV file with pandas' C
+        parser, as stripped strings. Leading '#' comment lines are skipped
+        and columns missing from the file are filled with ''.
+        
+        The parsed table is cached in a pickle next to the source file and
+        reused while the file's size and mtime, the cache format version
+        and the pandas version all match, so repeated runs over the same
+        files skip the TSV parse.
+        
+        Args:
+            columns: Names of the columns to read
+            
+        Returns:
+            DataFrame with exactly the given columns
+        """
+        cache_path = self._cache_path(columns)
+        stat = os.stat(self.file_path)
+        stamp = (_CACHE_VERSION, pd.__version__, stat.st_size, stat.st_mtime_ns)
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict) and cached.get("stamp") == stamp:
+                return cached["table"]
+        except OSError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+        
+        df = self._parse_tsv(columns)
+        
+        try:
+            partial_path = f"{cache_path}.part"
+            with open(partial_path, 'wb') as f:
+                pickle.dump({"stamp": stamp, "table": df}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache {cache_path}: {e}")
+        return df
+    
+    def _cache_path(self, columns):
+        """Cache file for the given columns of the adapter's TSV file"""
+        key = hashlib.md5('\t'.join(columns).encode('utf-8')).hexdigest()[:8]
+        return f"{self.file_path}.{key}.pkl"
+    
+    def _parse_tsv(self, columns):
+        """Parse the given columns of the adapter's TSV file (see _read_tsv)"""
+        # Open in binary so the comment scan stays in C and pandas decodes
+        # the body itself instead of going through a text wrapper (which also
+        # means no newline translation); read in 1 MiB blocks
+        with open(self.file_path, 'rb', buffering=1024 * 1024) as f:
+            # Start reading after the leading comment block
+            offset = 0
+            line = f.readline()
+            while line.startswith(b'#'):
+                offset = f.tell()
+                line = f.readline()
+            f.seek(offset)
+            
+            df = pd.read_csv(
+                f,
+                sep='\t',
+                dtype=str,
+                na_filter=False,
+                usecols=lambda column: column in columns,
+                encoding='utf-8',
+                engine='c',
+            )
+            for column in df.columns:
+                df[column] = df[column].str.strip()
+        
+        return df.reindex(columns=columns, fill_value='').fillna('')
+    
     def get_nodes(self):
         """Get nodes for the knowledge graph"""
         raise NotImplementedError("Subclasses must implement get_nodes()")
@@ -30,9 +111,12 @@ class HPOAdapter(KnowledgeGraphAdapter):
     def get_edges(self):
         """Get edges for the knowledge graph"""
         raise NotImplementedError("Subclasses must implement get_edges()")
-    
-    def get_statistics(self):
-        """Get statistics about the data"""
-        return {
-            "total_records": len(self.data)
-        }
+
+
+def _interned(series):
+    """
+    Column values as a list of interned strings. HPO association columns
+    repeat the same IDs and codes on many rows, and interning keeps one
+    string object per distinct value instead of one per row.
+    """
+    return list(map(sys.intern, series.tolist()))
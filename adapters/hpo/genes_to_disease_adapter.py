@@ -2,9 +2,19 @@
 Adapter for HPO genes_to_disease.txt file - Gene to Disease associations
 """
 
-from . import HPOAdapter
-import csv
+from . import HPOAdapter, _interned
 import logging
+from collections import namedtuple
+from operator import attrgetter
+
+# One row of genes_to_disease.txt, in file column order
+_Association = namedtuple(
+    "_Association", "ncbi_gene_id gene_symbol association_type disease_id source"
+)
+
+# Association properties copied onto edges when non-empty
+_EDGE_PROPERTIES = ('association_type', 'source')
+_edge_values = attrgetter(*_EDGE_PROPERTIES)
 
 class GenesToDiseaseAdapter(HPOAdapter):
     """Adapter for HPO genes_to_disease.txt file"""
@@ -12,49 +22,39 @@ class GenesToDiseaseAdapter(HPOAdapter):
     def __init__(self, file_path=None):
         """Initialize the adapter"""
         self.genes = {}
-        self.diseases = {}
+        self.diseases = set()
         self.associations = []
         super().__init__(file_path)
     
     def parse_data(self):
         """Parse data from genes_to_disease.txt file"""
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f, delimiter='\t')
-                
-                for row in reader:
-                    ncbi_gene_id = row.get('ncbi_gene_id', '').strip()
-                    gene_symbol = row.get('gene_symbol', '').strip()
-                    association_type = row.get('association_type', '').strip()
-                    disease_id = row.get('disease_id', '').strip()
-                    source = row.get('source', '').strip()
-                    
-                    if gene_symbol and disease_id:
-                        # Store gene info
-                        self.genes[gene_symbol] = {'data_source': 'HPO'}
-                        
-                        # Store disease info
-                        self.diseases[disease_id] = {'data_source': 'HPO'}
-                        
-                        # Store association
-                        association = {
-                            'gene_symbol': gene_symbol,
-                            'disease_id': disease_id,
-                            'association_type': association_type,
-                            'source': source,
-                            'ncbi_gene_id': ncbi_gene_id
-                        }
-                        self.associations.append(association)
-                        self.data.append(row)
-                        
-        except Exception as e:
-            self.logger.error(f"Error parsing genes_to_disease.txt file {self.file_path}: {e}")
+            df = self._read_tsv([
+                'ncbi_gene_id', 'gene_symbol', 'association_type', 'disease_id', 'source'
+            ])
+        except (OSError, ValueError) as e:
+            self.logger.exception(f"Error parsing genes_to_disease.txt file {self.file_path}: {e}")
+            return
+        
+        df = df[df['gene_symbol'].ne('') & df['disease_id'].ne('')]
+        
+        # Store unique gene and disease IDs; genes are kept in order of
+        # first appearance (values unused) and diseases only feed the
+        # statistics
+        self.genes.update(dict.fromkeys(df['gene_symbol'].unique()))
+        self.diseases.update(df['disease_id'].unique())
+        
+        # Store associations
+        self.associations.extend(map(
+            _Association._make,
+            zip(*(_interned(df[column]) for column in df.columns))
+        ))
     
     def get_nodes(self):
         """Get nodes for the knowledge graph"""
         # Gene nodes
-        for gene_symbol, gene_info in self.genes.items():
-            yield (gene_symbol, "gene", gene_info)
+        for gene_symbol in self.genes:
+            yield (gene_symbol, "gene", {'data_source': 'HPO'})
         
         # Disease nodes removed - they should only be created by PhenotypeHpoaAdapter
         # which has the proper disease_name data. Creating empty disease nodes here
@@ -64,24 +64,24 @@ class GenesToDiseaseAdapter(HPOAdapter):
         """Get edges for the knowledge graph"""
         for i, association in enumerate(self.associations):
             edge_id = f"gene_disease_{i}"
-            source = association['gene_symbol']
-            target = association['disease_id']
+            source = association.gene_symbol
+            target = association.disease_id
             
             # Edge properties (filter out empty values)
             properties = {
                 'data_source': 'hpo'
             }
             
-            for prop in ['association_type', 'source']:
-                if association.get(prop):
-                    properties[prop] = association[prop]
+            for prop, value in zip(_EDGE_PROPERTIES, _edge_values(association)):
+                if value:
+                    properties[prop] = value
             
             yield (edge_id, source, target, "gene to disease association", properties)
     
     def get_statistics(self):
         """Get statistics about the data"""
         return {
-            "total_records": len(self.data),
+            "total_records": len(self.associations),
             "unique_genes": len(self.genes),
             "unique_diseases": len(self.diseases),
             "associations": len(self.associations)
@@ -3,7 +3,9 @@ Base adapter for MESH data
 """
 
 from ..import KnowledgeGraphAdapter
+import gc
 import logging
+from contextlib import contextmanager
 
 class MeshAdapter(KnowledgeGraphAdapter):
     """Base adapter for MESH data"""
@@ -22,7 +24,8 @@ class MeshAdapter(KnowledgeGraphAdapter):
         self.relationships = []
         
         if file_path:
-            self.parse_data()
+            with _gc_paused():
+                self.parse_data()
     
     def parse_data(self):
         """Parse data from file"""
@@ -46,3 +49,20 @@ class MeshAdapter(KnowledgeGraphAdapter):
             "relationships": len(self.relationships),
             "total_entities": len(self.descriptors) + len(self.concepts) + len(self.terms) + len(self.qualifiers)
         }
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pause the cyclic garbage collector while parsing. A parse allocates
+    millions of small tuples, lists and records but creates no reference
+    cycles, so collections triggered by the allocations find nothing to
+    free and only cost time.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
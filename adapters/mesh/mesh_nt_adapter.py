@@ -2,40 +2,66 @@
 Adapter for MESH NT data
 """
 
-from . import MeshAdapter
+from . import MeshAdapter, _gc_paused
+import io
+import mmap
 import re
+import sys
 import logging
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Approximate size of the line-aligned byte ranges parsed by each worker
+PARSE_CHUNK_SIZE = 64 * 1024 * 1024
 
 class MeshAdapterComprehensive(MeshAdapter):
     """Comprehensive adapter for MESH NT data"""
     
-    def __init__(self, file_path=None):
-        """Initialize the adapter"""
-        super().__init__(file_path)
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, file_path=None, workers=None):
+        """
+        Initialize the adapter
         
-        # Additional data structures
-        self.tree_numbers = {}
-        self.annotations = {}
-        self.semantic_types = {}
+        Args:
+            file_path: Path to the MESH NT file
+            workers: Number of worker processes to parse the file with
+                (parsed serially when unset or 1)
+        """
+        # Additional data structures; set up before the base class
+        # constructor parses the file. Descriptors, concepts, terms and
+        # qualifiers are stored as id -> (label, uri) tuples, and preferred
+        # concepts by descriptor id. IDs are interned (see _uri_id), so the
+        # many relationships naming an entity share one string for its ID.
+        self.preferred_concepts = {}
+        self.tree_numbers = defaultdict(list)
+        self.annotations = defaultdict(list)
+        self.semantic_types = defaultdict(list)
+        self.workers = workers
         
-        if file_path:
-            self.parse_data()
+        # Positions in self.relationships of preferred-concept links whose
+        # descriptor was not labelled yet (only tracked by chunk workers)
+        self._unresolved_preferred = None
+        
+        super().__init__(file_path)
+        self.logger = logging.getLogger(__name__)
     
     def parse_data(self):
         """Parse data from NT file"""
         self.logger.info(f"Parsing MESH NT data from {self.file_path}")
         
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                line_count = 0
-                for line in f:
-                    line_count += 1
-                    if line_count % 100000 == 0:
-                        self.logger.info(f"Processed {line_count:,} lines")
-                    
-                    # Parse NT triple
-                    self._parse_triple(line)
+            if self.workers and self.workers > 1:
+                line_count = self._parse_parallel(self.workers)
+            else:
+                # Read bytes; only the fields that are kept get decoded
+                with open(self.file_path, 'rb') as f:
+                    line_count = 0
+                    for line in f:
+                        line_count += 1
+                        if line_count % 100000 == 0:
+                            self.logger.info(f"Processed {line_count:,} lines")
+                        
+                        # Parse NT triple
+                        self._parse_triple(line)
             
             self.logger.info(f"Finished parsing {line_count:,} lines")
             
@@ -44,117 +70,177 @@ class MeshAdapterComprehensive(MeshAdapter):
             import traceback
             traceback.print_exc()
     
+    def _parse_parallel(self, workers):
+        """
+        Parse line-aligned byte ranges of the file in a process pool and
+        merge the partial tables back in file order, so the result matches
+        the serial parse. Only a bounded number of ranges is in flight.
+        
+        Args:
+            workers: Number of worker processes
+            
+        Returns:
+            Number of lines parsed
+        """
+        line_count = 0
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for start, end in _line_ranges(self.file_path, PARSE_CHUNK_SIZE):
+                pending.append(executor.submit(_parse_chunk, self.file_path, start, end))
+                if len(pending) >= 2 * workers:
+                    line_count += self._merge_chunk(pending.popleft().result())
+                    self.logger.info(f"Processed {line_count:,} lines")
+            while pending:
+                line_count += self._merge_chunk(pending.popleft().result())
+                self.logger.info(f"Processed {line_count:,} lines")
+        return line_count
+    
+    def _merge_chunk(self, tables):
+        """
+        Merge the tables parsed from one byte range into this adapter's
+        tables, as if its lines had been parsed here.
+        
+        Args:
+            tables: Table attribute name -> table, from _parse_chunk
+            
+        Returns:
+            Number of lines in the range
+        """
+        # Preferred-concept links the worker could not check: they count
+        # only if the descriptor was labelled in an earlier range
+        relationships = tables["relationships"]
+        for index in tables["unresolved_preferred"]:
+            _, descriptor_id, concept_id, _ = relationships[index]
+            if descriptor_id in self.descriptors:
+                self.preferred_concepts[descriptor_id] = concept_id
+            else:
+                relationships[index] = None
+        
+        # Descriptors labelled in the range lose earlier preferred concepts
+        for descriptor_id in tables["descriptors"]:
+            self.preferred_concepts.pop(descriptor_id, None)
+        self.preferred_concepts.update(tables["preferred_concepts"])
+        
+        for name in ("descriptors", "concepts", "terms", "qualifiers"):
+            getattr(self, name).update(tables[name])
+        
+        for name in ("tree_numbers", "annotations", "semantic_types"):
+            merged = getattr(self, name)
+            for entity_id, values in tables[name].items():
+                merged[entity_id].extend(values)
+        
+        self.relationships.extend(
+            relationship for relationship in relationships if relationship is not None
+        )
+        return tables["line_count"]
+    
     def _parse_triple(self, line):
         """Parse an NT triple"""
-        # Basic NT triple pattern
-        pattern = r'<([^>]+)>\s+<([^>]+)>\s+(.+)\s+\.'
-        match = re.match(pattern, line)
+        match = _TRIPLE_RE.match(line)
         
         if not match:
             return
         
-        subject, predicate, obj = match.groups()
-        
-        # Process based on predicate
-        if "rdf-schema#label" in predicate:
-            # Extract label
-            label_match = re.match(r'"([^"]+)"', obj)
-            if label_match:
-                label = label_match.group(1)
-                
-                # Determine entity type from subject URI
-                if "/descriptor/" in subject:
-                    descriptor_id = subject.split("/")[-1]
-                    self.descriptors[descriptor_id] = {"label": label, "uri": subject}
-                elif "/concept/" in subject:
-                    concept_id = subject.split("/")[-1]
-                    self.concepts[concept_id] = {"label": label, "uri": subject}
-                elif "/term/" in subject:
-                    term_id = subject.split("/")[-1]
-                    self.terms[term_id] = {"label": label, "uri": subject}
-                elif "/qualifier/" in subject:
-                    qualifier_id = subject.split("/")[-1]
-                    self.qualifiers[qualifier_id] = {"label": label, "uri": subject}
-        
-        elif "preferredConcept" in predicate:
-            # Link descriptor to preferred concept
-            if "/descriptor/" in subject and "/concept/" in obj:
-                descriptor_id = subject.split("/")[-1]
-                concept_id = obj.split("/")[-1].replace(">", "")
-                
-                if descriptor_id in self.descriptors:
-                    self.descriptors[descriptor_id]["preferred_concept"] = concept_id
-                    self.relationships.append(("descriptor_to_concept", descriptor_id, concept_id, "preferred"))
-        
-        elif "concept" in predicate and "preferred" not in predicate:
-            # Link descriptor to concept
-            if "/descriptor/" in subject and "/concept/" in obj:
-                descriptor_id = subject.split("/")[-1]
-                concept_id = obj.split("/")[-1].replace(">", "")
-                
-                self.relationships.append(("descriptor_to_concept", descriptor_id, concept_id, "related"))
-        
-        elif "term" in predicate:
-            # Link concept to term
-            if "/concept/" in subject and "/term/" in obj:
-                concept_id = subject.split("/")[-1]
-                term_id = obj.split("/")[-1].replace(">", "")
-                
-                self.relationships.append(("concept_to_term", concept_id, term_id, "related"))
-        
-        elif "treeNumber" in predicate:
-            # Extract tree number
-            tree_match = re.match(r'"([^"]+)"', obj)
-            if tree_match and "/descriptor/" in subject:
-                tree_number = tree_match.group(1)
-                descriptor_id = subject.split("/")[-1]
-                
-                if descriptor_id not in self.tree_numbers:
-                    self.tree_numbers[descriptor_id] = []
-                
-                self.tree_numbers[descriptor_id].append(tree_number)
-        
-        elif "annotation" in predicate:
-            # Extract annotation
-            annotation_match = re.match(r'"([^"]+)"', obj)
-            if annotation_match:
-                annotation = annotation_match.group(1)
-                entity_id = subject.split("/")[-1]
-                
-                if entity_id not in self.annotations:
-                    self.annotations[entity_id] = []
-                
-                self.annotations[entity_id].append(annotation)
-        
-        elif "semanticType" in predicate:
-            # Extract semantic type
-            semantic_match = re.match(r'"([^"]+)"', obj)
-            if semantic_match and "/descriptor/" in subject:
-                semantic_type = semantic_match.group(1)
-                descriptor_id = subject.split("/")[-1]
-                
-                if descriptor_id not in self.semantic_types:
-                    self.semantic_types[descriptor_id] = []
-                
-                self.semantic_types[descriptor_id].append(semantic_type)
-        
-        elif "broader" in predicate or "narrower" in predicate:
-            # Handle hierarchical relationships
-            if "/descriptor/" in subject and "/descriptor/" in obj:
-                source_id = subject.split("/")[-1]
-                target_id = obj.split("/")[-1].replace(">", "")
-                rel_type = "broader" if "broader" in predicate else "narrower"
-                
-                self.relationships.append(("descriptor_hierarchy", source_id, target_id, rel_type))
+        subject, predicate, literal, obj = match.groups()
+        
+        # Dispatch on the local name of the predicate. A file uses only a
+        # few distinct predicates, so the handler is cached by full IRI
+        try:
+            handler = _HANDLERS_BY_IRI[predicate]
+        except KeyError:
+            handler = _HANDLERS_BY_IRI[predicate] = _PREDICATE_HANDLERS.get(
+                predicate.rsplit(b"#", 1)[-1].rsplit(b"/", 1)[-1]
+            )
+        if handler is not None:
+            handler(self, _uri_kind(subject), subject, literal, obj)
+    
+    def _handle_label(self, kind, subject, label, obj):
+        """Store the label of a descriptor, concept, term or qualifier"""
+        table = _LABELLED_TABLES.get(kind)
+        if label and table:
+            entity_id = _uri_id(subject)
+            getattr(self, table)[entity_id] = (label.decode(), subject.decode())
+            
+            # A new label replaces the whole descriptor record
+            if table == "descriptors":
+                self.preferred_concepts.pop(entity_id, None)
+    
+    def _handle_preferred_concept(self, kind, subject, literal, obj):
+        """Link descriptor to preferred concept"""
+        if kind == b"descriptor" and obj and _uri_kind(obj) == b"concept":
+            descriptor_id = _uri_id(subject)
+            concept_id = _uri_id(obj)
+            
+            if descriptor_id in self.descriptors:
+                self.preferred_concepts[descriptor_id] = concept_id
+                self.relationships.append(("descriptor_to_concept", descriptor_id, concept_id, "preferred"))
+            elif self._unresolved_preferred is not None:
+                # The descriptor may be labelled in an earlier range; the
+                # link is checked when the range is merged
+                self._unresolved_preferred.append(len(self.relationships))
+                self.relationships.append(("descriptor_to_concept", descriptor_id, concept_id, "preferred"))
+    
+    def _handle_concept(self, kind, subject, literal, obj):
+        """Link descriptor to concept"""
+        if kind == b"descriptor" and obj and _uri_kind(obj) == b"concept":
+            descriptor_id = _uri_id(subject)
+            concept_id = _uri_id(obj)
+            
+            self.relationships.append(("descriptor_to_concept", descriptor_id, concept_id, "related"))
+    
+    def _handle_term(self, kind, subject, literal, obj):
+        """Link concept to term"""
+        if kind == b"concept" and obj and _uri_kind(obj) == b"term":
+            concept_id = _uri_id(subject)
+            term_id = _uri_id(obj)
+            
+            self.relationships.append(("concept_to_term", concept_id, term_id, "related"))
+    
+    def _handle_tree_number(self, kind, subject, tree_number, obj):
+        """Store a descriptor tree number"""
+        if tree_number and kind == b"descriptor":
+            descriptor_id = _uri_id(subject)
+            
+            self.tree_numbers[descriptor_id].append(tree_number.decode())
+    
+    def _handle_annotation(self, kind, subject, annotation, obj):
+        """Store an annotation of any entity"""
+        if annotation:
+            entity_id = _uri_id(subject)
+            
+            self.annotations[entity_id].append(annotation.decode())
+    
+    def _handle_semantic_type(self, kind, subject, semantic_type, obj):
+        """Store a descriptor semantic type"""
+        if semantic_type and kind == b"descriptor":
+            descriptor_id = _uri_id(subject)
+            
+            self.semantic_types[descriptor_id].append(semantic_type.decode())
+    
+    def _handle_broader(self, kind, subject, literal, obj):
+        """Handle a broader hierarchical relationship"""
+        self._add_hierarchy(kind, subject, obj, "broader")
+    
+    def _handle_narrower(self, kind, subject, literal, obj):
+        """Handle a narrower hierarchical relationship"""
+        self._add_hierarchy(kind, subject, obj, "narrower")
+    
+    def _add_hierarchy(self, kind, subject, obj, rel_type):
+        """Link two descriptors hierarchically"""
+        if kind == b"descriptor" and obj and _uri_kind(obj) == b"descriptor":
+            source_id = _uri_id(subject)
+            target_id = _uri_id(obj)
+            
+            self.relationships.append(("descriptor_hierarchy", source_id, target_id, rel_type))
     
     def get_nodes(self):
         """Get nodes for the knowledge graph"""
         # Generate descriptor nodes
-        for descriptor_id, descriptor in self.descriptors.items():
+        for descriptor_id, (label, uri) in self.descriptors.items():
             properties = {
-                "name": descriptor.get("label", ""),
+                "name": label,
                 "id": descriptor_id,
-                "uri": descriptor.get("uri", "")
+                "uri": uri
             }
             
             # Add tree numbers if available
@@ -176,74 +262,178 @@ class MeshAdapterComprehensive(MeshAdapter):
             )
         
         # Generate concept nodes
-        for concept_id, concept in self.concepts.items():
+        for concept_id, (label, uri) in self.concepts.items():
             yield (
                 concept_id,
                 "mesh_concept",
                 {
-                    "name": concept.get("label", ""),
+                    "name": label,
                     "id": concept_id,
-                    "uri": concept.get("uri", ""),
+                    "uri": uri,
                     "data_source": "MeSH"
                 }
             )
         
         # Generate term nodes
-        for term_id, term in self.terms.items():
+        for term_id, (label, uri) in self.terms.items():
             yield (
                 term_id,
                 "mesh_term",
                 {
-                    "name": term.get("label", ""),
+                    "name": label,
                     "id": term_id,
-                    "uri": term.get("uri", ""),
+                    "uri": uri,
                     "data_source": "MeSH"
                 }
             )
         
         # Generate qualifier nodes
-        for qualifier_id, qualifier in self.qualifiers.items():
+        for qualifier_id, (label, uri) in self.qualifiers.items():
             yield (
                 qualifier_id,
                 "mesh_qualifier",
                 {
-                    "name": qualifier.get("label", ""),
+                    "name": label,
                     "id": qualifier_id,
-                    "uri": qualifier.get("uri", "")
+                    "uri": uri
                 }
             )
     
     def get_edges(self):
         """Get edges for the knowledge graph"""
-        # Generate edges from relationships
+        # Generate edges from relationships; the properties dict is built
+        # per edge, since consumers may modify it
         for rel_type, source_id, target_id, subtype in self.relationships:
-            if rel_type == "descriptor_to_concept":
+            label = _EDGE_LABELS.get(rel_type)
+            if label is not None:
                 yield (
                     source_id,
                     target_id,
-                    "mesh_descriptor_to_concept",
-                    {
-                        "relationship_type": subtype,
-                        "data_source": "MESH"
-                    }
-                )
-            elif rel_type == "concept_to_term":
-                yield (
-                    source_id,
-                    target_id,
-                    "mesh_concept_to_term",
-                    {
-                        "relationship_type": subtype,
-                        "data_source": "MESH"
-                    }
-                )
-            elif rel_type == "descriptor_hierarchy":
-                yield (
-                    source_id,
-                    target_id,
-                    "mesh_descriptor_hierarchy",
+                    label,
                     {
                         "relationship_type": subtype,
                         "data_source": "MESH"
                     }
                 )
+
+
+# Edge labels by relationship type
+_EDGE_LABELS = {
+    "descriptor_to_concept": "mesh_descriptor_to_concept",
+    "concept_to_term": "mesh_concept_to_term",
+    "descriptor_hierarchy": "mesh_descriptor_hierarchy",
+}
+
+# One NT triple (as bytes): subject IRI, predicate IRI, and the object as
+# either a literal's lexical form or an IRI. The statement must end in
+# whitespace and '.'; a single \s is enough there, since .* takes up any
+# further whitespace without backtracking over it. (A hand-written
+# bytes.find scanner was tried and is ~3x slower than this in CPython.)
+_TRIPLE_RE = re.compile(rb'<([^>]+)>\s+<([^>]+)>\s+(?:"([^"]*)"|<([^>]+)>).*\s\.')
+
+# Entity tables filled from rdfs:label, by the URI path segment before the ID
+_LABELLED_TABLES = {
+    b"descriptor": "descriptors",
+    b"concept": "concepts",
+    b"term": "terms",
+    b"qualifier": "qualifiers",
+}
+
+# Triple handlers by predicate local name
+_PREDICATE_HANDLERS = {
+    b"label": MeshAdapterComprehensive._handle_label,
+    b"preferredConcept": MeshAdapterComprehensive._handle_preferred_concept,
+    b"concept": MeshAdapterComprehensive._handle_concept,
+    b"term": MeshAdapterComprehensive._handle_term,
+    b"treeNumber": MeshAdapterComprehensive._handle_tree_number,
+    b"annotation": MeshAdapterComprehensive._handle_annotation,
+    b"semanticType": MeshAdapterComprehensive._handle_semantic_type,
+    b"broader": MeshAdapterComprehensive._handle_broader,
+    b"broaderDescriptor": MeshAdapterComprehensive._handle_broader,
+    b"broaderConcept": MeshAdapterComprehensive._handle_broader,
+    b"broaderQualifier": MeshAdapterComprehensive._handle_broader,
+    b"narrower": MeshAdapterComprehensive._handle_narrower,
+    b"narrowerDescriptor": MeshAdapterComprehensive._handle_narrower,
+    b"narrowerConcept": MeshAdapterComprehensive._handle_narrower,
+    b"narrowerQualifier": MeshAdapterComprehensive._handle_narrower,
+}
+
+# Triple handlers (or None) by full predicate IRI, filled as predicates are
+# first seen
+_HANDLERS_BY_IRI = {}
+
+
+def _uri_id(uri):
+    """Interned ID at the end of a MeSH URI (bytes), e.g. 'D000001'"""
+    return sys.intern(uri[uri.rfind(b"/") + 1:].decode())
+
+
+def _uri_kind(uri):
+    """Path segment before the ID in a MeSH URI (bytes), e.g. b'descriptor'"""
+    parts = uri.rsplit(b"/", 2)
+    return parts[1] if len(parts) == 3 else b""
+
+
+def _line_ranges(file_path, chunk_size):
+    """
+    Split a file into byte ranges of about chunk_size that each end just
+    after a newline, so no line is split between ranges.
+    
+    Args:
+        file_path: Path to the file
+        chunk_size: Approximate size of each range in bytes
+        
+    Returns:
+        List of (start, end) byte offsets
+    """
+    ranges = []
+    with open(file_path, 'rb') as f:
+        size = f.seek(0, io.SEEK_END)
+        if size == 0:
+            return ranges
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                newline = mm.find(b"\n", min(start + chunk_size, size) - 1)
+                end = size if newline == -1 else newline + 1
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+
+def _parse_chunk(file_path, start, end):
+    """
+    Parse the lines in one byte range of an NT file in a worker process.
+    
+    Args:
+        file_path: Path to the MESH NT file
+        start: Offset of the first byte of the range
+        end: Offset just past the last byte of the range
+        
+    Returns:
+        Table attribute name -> table, for MeshAdapterComprehensive._merge_chunk
+    """
+    adapter = MeshAdapterComprehensive()
+    adapter._unresolved_preferred = []
+    
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    
+    line_count = 0
+    with _gc_paused():
+        for line in io.BytesIO(data):
+            line_count += 1
+            adapter._parse_triple(line)
+    
+    tables = {
+        name: getattr(adapter, name)
+        for name in (
+            "descriptors", "concepts", "terms", "qualifiers", "preferred_concepts",
+            "tree_numbers", "annotations", "semantic_types", "relationships",
+        )
+    }
+    tables["unresolved_preferred"] = adapter._unresolved_preferred
+    tables["line_count"] = line_count
+    return tables
@@ -2,194 +2,265 @@
 Adapter for MESH XML data
 """
 
-from . import MeshAdapter
+from . import MeshAdapter, _gc_paused
+import io
+import mmap
 import xml.etree.ElementTree as ET
 import logging
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+# Approximate size of the byte ranges of whole descriptor records parsed by
+# each worker
+PARSE_CHUNK_SIZE = 16 * 1024 * 1024
 
 class MeshXmlAdapter(MeshAdapter):
     """Adapter for MESH XML data"""
     
-    def __init__(self, file_path=None):
-        """Initialize the adapter"""
-        super().__init__(file_path)
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, file_path=None, workers=None):
+        """
+        Initialize the adapter
         
-        # Additional data structures
-        self.tree_numbers = {}
-        self.annotations = {}
-        self.semantic_types = {}
-        self.pharmacological_actions = {}
+        Args:
+            file_path: Path to the MESH XML file
+            workers: Number of worker processes to parse the file with
+                (parsed serially when unset or 1)
+        """
+        # Additional data structures; set up before the base class
+        # constructor parses the file
+        self.tree_numbers = defaultdict(list)
+        self.annotations = defaultdict(list)
+        self.semantic_types = defaultdict(list)
+        self.pharmacological_actions = defaultdict(list)
+        self.workers = workers
         
-        if file_path:
-            self.parse_data()
+        super().__init__(file_path)
+        self.logger = logging.getLogger(__name__)
     
     def parse_data(self):
         """Parse data from XML file"""
         self.logger.info(f"Parsing MESH XML data from {self.file_path}")
         
         try:
-            # Use iterparse to handle large XML files
-            context = ET.iterparse(self.file_path, events=("start", "end"))
-            
-            # Track current elements
-            current_descriptor = None
-            current_concept = None
-            current_term = None
+            self._descriptor_count = 0
             
-            descriptor_count = 0
+            if self.workers and self.workers > 1:
+                self._parse_parallel(self.workers)
+            else:
+                self._iterparse(self.file_path)
             
-            for event, elem in context:
-                # Start of a descriptor record
-                if event == "start" and elem.tag == "DescriptorRecord":
-                    current_descriptor = {"concepts": []}
-                    descriptor_id = elem.get("DescriptorUI")
-                    if descriptor_id:
-                        current_descriptor["id"] = descriptor_id
-                
-                # End of a descriptor record
-                elif event == "end" and elem.tag == "DescriptorRecord":
-                    if "id" in current_descriptor:
-                        descriptor_id = current_descriptor["id"]
-                        self.descriptors[descriptor_id] = current_descriptor
-                        
-                        descriptor_count += 1
-                        if descriptor_count % 1000 == 0:
-                            self.logger.info(f"Processed {descriptor_count:,} descriptors")
-                    
-                    current_descriptor = None
-                    elem.clear()  # Free memory
-                
-                # Descriptor name
-                elif event == "end" and elem.tag == "DescriptorName" and current_descriptor:
-                    name_elem = elem.find("String")
-                    if name_elem is not None and name_elem.text:
-                        current_descriptor["name"] = name_elem.text
-                
-                # Tree numbers
-                elif event == "end" and elem.tag == "TreeNumber" and current_descriptor:
-                    if elem.text:
-                        if "tree_numbers" not in current_descriptor:
-                            current_descriptor["tree_numbers"] = []
-                        current_descriptor["tree_numbers"].append(elem.text)
-                        
-                        # Also store in separate dictionary for easy access
-                        descriptor_id = current_descriptor["id"]
-                        if descriptor_id not in self.tree_numbers:
-                            self.tree_numbers[descriptor_id] = []
-                        self.tree_numbers[descriptor_id].append(elem.text)
-                
-                # Start of a concept
-                elif event == "start" and elem.tag == "Concept":
-                    current_concept = {"terms": []}
-                    concept_id = elem.get("ConceptUI")
-                    if concept_id:
-                        current_concept["id"] = concept_id
-                
-                # End of a concept
-                elif event == "end" and elem.tag == "Concept":
-                    if current_descriptor and "id" in current_concept:
-                        concept_id = current_concept["id"]
-                        self.concepts[concept_id] = current_concept
-                        
-                        # Link concept to descriptor
-                        current_descriptor["concepts"].append(concept_id)
-                        
-                        # Check if preferred concept
-                        if elem.get("PreferredConceptYN") == "Y":
-                            current_descriptor["preferred_concept"] = concept_id
-                            self.relationships.append(("descriptor_to_concept", current_descriptor["id"], concept_id, "preferred"))
-                        else:
-                            self.relationships.append(("descriptor_to_concept", current_descriptor["id"], concept_id, "related"))
-                    
-                    current_concept = None
-                
-                # Concept name
-                elif event == "end" and elem.tag == "ConceptName" and current_concept:
-                    name_elem = elem.find("String")
-                    if name_elem is not None and name_elem.text:
-                        current_concept["name"] = name_elem.text
-                
-                # Start of a term
-                elif event == "start" and elem.tag == "Term":
-                    current_term = {}
-                    term_id = elem.get("TermUI")
-                    if term_id:
-                        current_term["id"] = term_id
-                
-                # End of a term
-                elif event == "end" and elem.tag == "Term":
-                    if current_concept and "id" in current_term:
-                        term_id = current_term["id"]
-                        self.terms[term_id] = current_term
-                        
-                        # Link term to concept
-                        current_concept["terms"].append(term_id)
-                        self.relationships.append(("concept_to_term", current_concept["id"], term_id, "related"))
-                    
-                    current_term = None
-                
-                # Term name
-                elif event == "end" and elem.tag == "TermName" and current_term:
-                    if elem.text:
-                        current_term["name"] = elem.text
-                
-                # Semantic types
-                elif event == "end" and elem.tag == "SemanticTypeUI" and current_descriptor:
-                    if elem.text:
-                        if "semantic_types" not in current_descriptor:
-                            current_descriptor["semantic_types"] = []
-                        current_descriptor["semantic_types"].append(elem.text)
-                        
-                        # Also store in separate dictionary
-                        descriptor_id = current_descriptor["id"]
-                        if descriptor_id not in self.semantic_types:
-                            self.semantic_types[descriptor_id] = []
-                        self.semantic_types[descriptor_id].append(elem.text)
-                
-                # Pharmacological actions
-                elif event == "end" and elem.tag == "PharmacologicalAction" and current_descriptor:
-                    action_elem = elem.find("DescriptorReferredTo/DescriptorUI")
-                    if action_elem is not None and action_elem.text:
-                        if "pharmacological_actions" not in current_descriptor:
-                            current_descriptor["pharmacological_actions"] = []
-                        current_descriptor["pharmacological_actions"].append(action_elem.text)
-                        
-                        # Also store in separate dictionary
-                        descriptor_id = current_descriptor["id"]
-                        if descriptor_id not in self.pharmacological_actions:
-                            self.pharmacological_actions[descriptor_id] = []
-                        self.pharmacological_actions[descriptor_id].append(action_elem.text)
-                        
-                        # Add relationship
-                        self.relationships.append(("pharmacological_action", descriptor_id, action_elem.text, "has_action"))
-            
-            self.logger.info(f"Finished parsing {descriptor_count:,} descriptors")
+            self.logger.info(f"Finished parsing {self._descriptor_count:,} descriptors")
             
         except Exception as e:
             self.logger.error(f"Error parsing MESH XML data: {e}")
             import traceback
             traceback.print_exc()
     
+    def _iterparse(self, source):
+        """
+        Parse descriptor records from an XML file or file object
+        
+        Args:
+            source: Path or binary file object of a DescriptorRecordSet
+        """
+        # Use iterparse to handle large XML files
+        context = iter(ET.iterparse(source, events=("start", "end")))
+        
+        # Keep the root, so finished records can be dropped from it
+        event, self._root = next(context)
+        
+        # Track current elements
+        self._current_descriptor = None
+        self._current_concept = None
+        self._current_term = None
+        
+        # Only a handful of tags are of interest; look their handler up
+        # instead of testing every element against each of them
+        for event, elem in chain([(event, self._root)], context):
+            handler = (_END_HANDLERS if event == "end" else _START_HANDLERS).get(elem.tag)
+            if handler is not None:
+                handler(self, elem)
+    
+    def _parse_parallel(self, workers):
+        """
+        Parse byte ranges of whole descriptor records in a process pool and
+        merge the partial tables back in file order, so the result matches
+        the serial parse. Only a bounded number of ranges is in flight.
+        
+        Args:
+            workers: Number of worker processes
+        """
+        header, ranges = _record_ranges(self.file_path, PARSE_CHUNK_SIZE)
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for start, end in ranges:
+                pending.append(executor.submit(_parse_chunk, self.file_path, header, start, end))
+                if len(pending) >= 2 * workers:
+                    self._merge_chunk(pending.popleft().result())
+            while pending:
+                self._merge_chunk(pending.popleft().result())
+    
+    def _merge_chunk(self, tables):
+        """
+        Merge the tables parsed from one byte range into this adapter's
+        tables, as if its records had been parsed here.
+        
+        Args:
+            tables: Table attribute name -> table, from _parse_chunk
+        """
+        for name in ("descriptors", "concepts", "terms"):
+            getattr(self, name).update(tables[name])
+        
+        for name in ("tree_numbers", "semantic_types", "pharmacological_actions"):
+            merged = getattr(self, name)
+            for descriptor_id, values in tables[name].items():
+                merged[descriptor_id].extend(values)
+        
+        self.relationships.extend(tables["relationships"])
+        
+        self._descriptor_count += tables["descriptor_count"]
+        self.logger.info(f"Processed {self._descriptor_count:,} descriptors")
+    
+    def _start_descriptor_record(self, elem):
+        """Start of a descriptor record"""
+        self._current_descriptor = _Descriptor(elem.get("DescriptorUI"))
+    
+    def _end_descriptor_record(self, elem):
+        """End of a descriptor record"""
+        current_descriptor = self._current_descriptor
+        if current_descriptor.id:
+            descriptor_id = current_descriptor.id
+            self.descriptors[descriptor_id] = current_descriptor
+            
+            self._descriptor_count += 1
+            if self._descriptor_count % 1000 == 0:
+                self.logger.info(f"Processed {self._descriptor_count:,} descriptors")
+        
+        self._current_descriptor = None
+        
+        # Free memory, including the emptied records kept by the root
+        elem.clear()
+        self._root.clear()
+    
+    def _end_descriptor_name(self, elem):
+        """Descriptor name"""
+        if self._current_descriptor:
+            name_elem = elem.find("String")
+            if name_elem is not None and name_elem.text:
+                self._current_descriptor.name = name_elem.text
+    
+    def _end_tree_number(self, elem):
+        """Tree numbers"""
+        current_descriptor = self._current_descriptor
+        if current_descriptor and elem.text:
+            current_descriptor.tree_numbers.append(elem.text)
+            
+            # Also store in separate dictionary for easy access
+            descriptor_id = current_descriptor.id
+            self.tree_numbers[descriptor_id].append(elem.text)
+    
+    def _start_concept(self, elem):
+        """Start of a concept"""
+        self._current_concept = _Concept(elem.get("ConceptUI"))
+    
+    def _end_concept(self, elem):
+        """End of a concept"""
+        current_descriptor = self._current_descriptor
+        current_concept = self._current_concept
+        if current_descriptor and current_concept.id:
+            concept_id = current_concept.id
+            self.concepts[concept_id] = current_concept
+            
+            # Link concept to descriptor
+            current_descriptor.concepts.append(concept_id)
+            
+            # Check if preferred concept
+            if elem.get("PreferredConceptYN") == "Y":
+                current_descriptor.preferred_concept = concept_id
+                self.relationships.append(("descriptor_to_concept", current_descriptor.id, concept_id, "preferred"))
+            else:
+                self.relationships.append(("descriptor_to_concept", current_descriptor.id, concept_id, "related"))
+        
+        self._current_concept = None
+    
+    def _end_concept_name(self, elem):
+        """Concept name"""
+        if self._current_concept:
+            name_elem = elem.find("String")
+            if name_elem is not None and name_elem.text:
+                self._current_concept.name = name_elem.text
+    
+    def _start_term(self, elem):
+        """Start of a term"""
+        self._current_term = _Term(elem.get("TermUI"))
+    
+    def _end_term(self, elem):
+        """End of a term"""
+        current_concept = self._current_concept
+        current_term = self._current_term
+        if current_concept and current_term.id:
+            term_id = current_term.id
+            self.terms[term_id] = current_term
+            
+            # Link term to concept
+            current_concept.terms.append(term_id)
+            self.relationships.append(("concept_to_term", current_concept.id, term_id, "related"))
+        
+        self._current_term = None
+    
+    def _end_term_name(self, elem):
+        """Term name"""
+        if self._current_term and elem.text:
+            self._current_term.name = elem.text
+    
+    def _end_semantic_type(self, elem):
+        """Semantic types"""
+        current_descriptor = self._current_descriptor
+        if current_descriptor and elem.text:
+            current_descriptor.semantic_types.append(elem.text)
+            
+            # Also store in separate dictionary
+            descriptor_id = current_descriptor.id
+            self.semantic_types[descriptor_id].append(elem.text)
+    
+    def _end_pharmacological_action(self, elem):
+        """Pharmacological actions"""
+        current_descriptor = self._current_descriptor
+        if not current_descriptor:
+            return
+        
+        action_elem = elem.find("DescriptorReferredTo/DescriptorUI")
+        if action_elem is not None and action_elem.text:
+            current_descriptor.pharmacological_actions.append(action_elem.text)
+            
+            # Also store in separate dictionary
+            descriptor_id = current_descriptor.id
+            self.pharmacological_actions[descriptor_id].append(action_elem.text)
+            
+            # Add relationship
+            self.relationships.append(("pharmacological_action", descriptor_id, action_elem.text, "has_action"))
+    
     def get_nodes(self):
         """Get nodes for the knowledge graph"""
         # Generate descriptor nodes
         for descriptor_id, descriptor in self.descriptors.items():
             properties = {
-                "name": descriptor.get("name", ""),
+                "name": descriptor.name,
                 "id": descriptor_id
             }
             
             # Add tree numbers if available
-            if "tree_numbers" in descriptor:
-                properties["tree_numbers"] = "|".join(descriptor["tree_numbers"])
+            if descriptor.tree_numbers:
+                properties["tree_numbers"] = "|".join(descriptor.tree_numbers)
             
             # Add semantic types if available
-            if "semantic_types" in descriptor:
-                properties["semantic_types"] = "|".join(descriptor["semantic_types"])
+            if descriptor.semantic_types:
+                properties["semantic_types"] = "|".join(descriptor.semantic_types)
             
             # Add pharmacological actions if available
-            if "pharmacological_actions" in descriptor:
-                properties["pharmacological_actions"] = "|".join(descriptor["pharmacological_actions"])
+            if descriptor.pharmacological_actions:
+                properties["pharmacological_actions"] = "|".join(descriptor.pharmacological_actions)
             
             yield (
                 descriptor_id,
@@ -203,7 +274,7 @@ class MeshXmlAdapter(MeshAdapter):
                 concept_id,
                 "mesh_concept",
                 {
-                    "name": concept.get("name", ""),
+                    "name": concept.name,
                     "id": concept_id,
                     "data_source": "MeSH"
                 }
@@ -215,7 +286,7 @@ class MeshXmlAdapter(MeshAdapter):
                 term_id,
                 "mesh_term",
                 {
-                    "name": term.get("name", ""),
+                    "name": term.name,
                     "id": term_id,
                     "data_source": "MeSH"
                 }
@@ -223,35 +294,152 @@ class MeshXmlAdapter(MeshAdapter):
     
     def get_edges(self):
         """Get edges for the knowledge graph"""
-        # Generate edges from relationships
+        # Generate edges from relationships; the properties dict is built
+        # per edge, since consumers may modify it
         for rel_type, source_id, target_id, subtype in self.relationships:
-            if rel_type == "descriptor_to_concept":
-                yield (
-                    source_id,
-                    target_id,
-                    "mesh_descriptor_to_concept",
-                    {
-                        "relationship_type": subtype,
-                        "data_source": "MESH"
-                    }
-                )
-            elif rel_type == "concept_to_term":
-                yield (
-                    source_id,
-                    target_id,
-                    "mesh_concept_to_term",
-                    {
-                        "relationship_type": subtype,
-                        "data_source": "MESH"
-                    }
-                )
-            elif rel_type == "pharmacological_action":
+            label = _EDGE_LABELS.get(rel_type)
+            if label is not None:
                 yield (
                     source_id,
                     target_id,
-                    "mesh_pharmacological_action",
+                    label,
                     {
                         "relationship_type": subtype,
                         "data_source": "MESH"
                     }
                 )
+
+
+class _Descriptor:
+    """Descriptor record; slotted, as there is one per MeSH descriptor"""
+    __slots__ = (
+        "id", "name", "concepts", "preferred_concept", "tree_numbers",
+        "semantic_types", "pharmacological_actions",
+    )
+    
+    def __init__(self, descriptor_id):
+        self.id = descriptor_id
+        self.name = ""
+        self.concepts = []
+        self.preferred_concept = None
+        self.tree_numbers = []
+        self.semantic_types = []
+        self.pharmacological_actions = []
+
+
+class _Concept:
+    """Concept record; slotted, as there is one per MeSH concept"""
+    __slots__ = ("id", "name", "terms")
+    
+    def __init__(self, concept_id):
+        self.id = concept_id
+        self.name = ""
+        self.terms = []
+
+
+class _Term:
+    """Term record; slotted, as there is one per MeSH term"""
+    __slots__ = ("id", "name")
+    
+    def __init__(self, term_id):
+        self.id = term_id
+        self.name = ""
+
+
+# Edge labels by relationship type
+_EDGE_LABELS = {
+    "descriptor_to_concept": "mesh_descriptor_to_concept",
+    "concept_to_term": "mesh_concept_to_term",
+    "pharmacological_action": "mesh_pharmacological_action",
+}
+
+# Closing tag of a descriptor record; byte ranges parsed in parallel end
+# just after one
+_RECORD_END = b"</DescriptorRecord>"
+
+# iterparse handlers by element tag, for start and end events
+_START_HANDLERS = {
+    "DescriptorRecord": MeshXmlAdapter._start_descriptor_record,
+    "Concept": MeshXmlAdapter._start_concept,
+    "Term": MeshXmlAdapter._start_term,
+}
+
+_END_HANDLERS = {
+    "DescriptorRecord": MeshXmlAdapter._end_descriptor_record,
+    "DescriptorName": MeshXmlAdapter._end_descriptor_name,
+    "TreeNumber": MeshXmlAdapter._end_tree_number,
+    "Concept": MeshXmlAdapter._end_concept,
+    "ConceptName": MeshXmlAdapter._end_concept_name,
+    "Term": MeshXmlAdapter._end_term,
+    "TermName": MeshXmlAdapter._end_term_name,
+    "SemanticTypeUI": MeshXmlAdapter._end_semantic_type,
+    "PharmacologicalAction": MeshXmlAdapter._end_pharmacological_action,
+}
+
+
+def _record_ranges(file_path, chunk_size):
+    """
+    Split the records of a DescriptorRecordSet file into byte ranges of
+    about chunk_size that each end just after a </DescriptorRecord>, so no
+    record is split between ranges.
+    
+    Args:
+        file_path: Path to the MESH XML file
+        chunk_size: Approximate size of each range in bytes
+        
+    Returns:
+        The bytes before the first record (XML declaration, DOCTYPE and the
+        root start tag), and a list of (start, end) byte offsets
+    """
+    with open(file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        root = mm.find(b"<DescriptorRecordSet")
+        body_start = mm.find(b">", root) + 1
+        body_end = mm.rfind(b"</DescriptorRecordSet>")
+        if root == -1 or body_start == 0 or body_end < body_start:
+            raise ValueError(f"No DescriptorRecordSet element in {file_path}")
+        
+        ranges = []
+        start = body_start
+        while start < body_end:
+            close = mm.find(_RECORD_END, max(start, start + chunk_size - len(_RECORD_END)), body_end)
+            end = body_end if close == -1 else close + len(_RECORD_END)
+            ranges.append((start, end))
+            start = end
+        return mm[:body_start], ranges
+
+
+def _parse_chunk(file_path, header, start, end):
+    """
+    Parse the descriptor records in one byte range of a MESH XML file in a
+    worker process.
+    
+    Args:
+        file_path: Path to the MESH XML file
+        header: The file's bytes before the first record, from _record_ranges
+        start: Offset of the first byte of the range
+        end: Offset just past the last byte of the range
+        
+    Returns:
+        Table attribute name -> table, for MeshXmlAdapter._merge_chunk
+    """
+    adapter = MeshXmlAdapter()
+    adapter._descriptor_count = 0
+    
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    
+    # Re-wrap the records in the file's own prolog and root element
+    with _gc_paused():
+        adapter._iterparse(io.BytesIO(header + data + b"</DescriptorRecordSet>"))
+    
+    tables = {
+        name: getattr(adapter, name)
+        for name in (
+            "descriptors", "concepts", "terms", "tree_numbers", "semantic_types",
+            "pharmacological_actions", "relationships",
+        )
+    }
+    tables["descriptor_count"] = adapter._descriptor_count
+    return tables
@@ -10,7 +10,7 @@ import os
 import sys
 import time
 import argparse
-import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
 
 from biocypher import BioCypher
 from utils.filehandler import FileHandler
+from utils.yaml_loader import load_yaml
 from adapters.civic.civic_adapter_fixed import CivicAdapterFixed
 from adapters.civic.civic_assertion_adapter import CivicAssertionAdapter
 from utils.neptune_converter import convert_to_neptune
@@ -36,10 +37,7 @@ def load_config(config_path="/app/config/kg_config.yaml"):
         Dictionary containing all configuration
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        return config
+        return load_yaml(config_path)
     
     except Exception as e:
         logger.error(f"Error loading config: {e}")
@@ -78,13 +76,23 @@ def get_civic_data_files(config, main_config=None):
             if 'url' in dataset_config:
                 default_urls[key] = dataset_config['url']
     
-    # Download or locate files
-    for file_type, url in default_urls.items():
-        logger.info(f"Getting CIViC {file_type} data...")
+    # Download or locate files. The downloads are dominated by network
+    # latency, so all files are fetched at once; results are checked in
+    # the order of the URLs
+    with ThreadPoolExecutor(max_workers=len(default_urls)) as executor:
+        futures = {}
+        for file_type, url in default_urls.items():
+            logger.info(f"Getting CIViC {file_type} data...")
+            futures[file_type] = executor.submit(
+                file_handler.download_file, f"civic_{file_type}", url, force=False
+            )
+    
+    for file_type, future in futures.items():
+        url = default_urls[file_type]
         
         # Try to download from URL
         try:
-            file_path = file_handler.download_file(f"civic_{file_type}", url, force=False)
+            file_path = future.result()
             if file_path and file_path.exists():
                 data_files[file_type] = str(file_path)
                 logger.info(f"✅ {file_type}: {file_path}")
@@ -95,8 +103,26 @@ def get_civic_data_files(config, main_config=None):
     
     return data_files
 
+def _counted(items, counts, kind):
+    """
+    Yield items, counting them as they are consumed
+    
+    Args:
+        items: Iterable of node or edge tuples
+        counts: Dictionary filled with kind -> count once items are exhausted
+        kind: Key to store the count under
+        
+    Yields:
+        The items
+    """
+    count = 0
+    for item in items:
+        count += 1
+        yield item
+    counts[kind] = count
+
 def build_civic_knowledge_graph(data_dir=None, output_dir=None, download_data=False, 
-                               convert_to_neptune_format=False, config=None):
+                               convert_to_neptune_format=False, config=None, workers=None):
     """
     Build CIViC knowledge graph using BioCypher
     
@@ -106,6 +132,8 @@ def build_civic_knowledge_graph(data_dir=None, output_dir=None, download_data=Fa
         download_data: Whether to download data from CIViC URLs
         convert_to_neptune_format: Whether to convert the output to Neptune format
         config: Configuration dictionary
+        workers: Number of processes to parse the TSV files with (defaults to
+            civic.parse_workers in the config; serial if unset)
     """
     start_time = time.time()
     
@@ -161,7 +189,9 @@ def build_civic_knowledge_graph(data_dir=None, output_dir=None, download_data=Fa
     
     # Initialize CIViC adapter
     logger.info("Initializing CIViC adapter...")
-    civic_adapter = CivicAdapterFixed(data_dir=data_dir)
+    if workers is None:
+        workers = (config.get('civic') or {}).get('parse_workers')
+    civic_adapter = CivicAdapterFixed(data_dir=data_dir, workers=workers)
     
     logger.info(f"Adapter initialization took: {time.time() - start_time:.2f} seconds")
     
@@ -174,12 +204,10 @@ def build_civic_knowledge_graph(data_dir=None, output_dir=None, download_data=Fa
     logger.info("Writing nodes to BioCypher...")
     nodes_start = time.time()
     
-    # Get all nodes from the fixed adapter
-    all_nodes = list(civic_adapter.get_nodes())
-    logger.info(f"Total nodes extracted: {len(all_nodes):,}")
-    
-    # Write nodes to BioCypher
-    bc.write_nodes(all_nodes)
+    # Stream nodes from the fixed adapter to BioCypher
+    counts = {}
+    bc.write_nodes(_counted(civic_adapter.get_nodes(), counts, "nodes"))
+    logger.info(f"Total nodes written: {counts.get('nodes', 0):,}")
     logger.info("Nodes written successfully")
     
     logger.info(f"Node writing took: {time.time() - nodes_start:.2f} seconds")
@@ -188,12 +216,9 @@ def build_civic_knowledge_graph(data_dir=None, output_dir=None, download_data=Fa
     logger.info("Writing edges to BioCypher...")
     edges_start = time.time()
     
-    # Get all edges from the fixed adapter
-    all_edges = list(civic_adapter.get_edges())
-    logger.info(f"Total edges extracted: {len(all_edges):,}")
-    
-    # Write edges to BioCypher
-    bc.write_edges(all_edges)
+    # Stream edges from the fixed adapter to BioCypher
+    bc.write_edges(_counted(civic_adapter.get_edges(), counts, "edges"))
+    logger.info(f"Total edges written: {counts.get('edges', 0):,}")
     logger.info("Edges written successfully")
     
     logger.info(f"Edge writing took: {time.time() - edges_start:.2f} seconds")
@@ -233,6 +258,7 @@ def main():
     parser.add_argument("--download", "-w", action="store_true", help="Download data from CIViC URLs")
     parser.add_argument("--neptune", "-n", action="store_true", help="Convert output to Neptune format")
     parser.add_argument("--config", "-c", help="Configuration file path")
+    parser.add_argument("--workers", type=int, help="Number of processes to parse the TSV files with")
     args = parser.parse_args()
     
     # Load config if provided
@@ -246,7 +272,8 @@ def main():
             output_dir=args.output_dir,
             download_data=args.download,
             convert_to_neptune_format=args.neptune,
-            config=config
+            config=config,
+            workers=args.workers
         )
         
         logger.info("\n" + "=" * 60)
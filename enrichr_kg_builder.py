@@ -2,7 +2,6 @@ import os
 import sys
 import time
 import argparse
-import yaml
 from pathlib import Path
 import logging
 
@@ -13,6 +12,7 @@ logger = logging.getLogger(__name__)
 
 from biocypher import BioCypher
 from utils.filehandler import FileHandler
+from utils.yaml_loader import load_yaml
 from adapters.enrichr.reactome_adapter import ReactomeAdapter
 from adapters.enrichr.wikipathway_adapter import WikiPathwayAdapter
 from adapters.enrichr.biological_process_adapter import BiologicalProcessAdapter
@@ -32,10 +32,7 @@ def load_config(config_path="/app/config/kg_config.yaml"):
         Dictionary containing all configuration
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        return config
+        return load_yaml(config_path)
     
     except Exception as e:
         logger.error(f"Error loading config: {e}")
@@ -8,7 +8,7 @@ import os
 import sys
 import time
 import argparse
-import yaml
+from concurrent.futures import ProcessPoolExecutor
 import requests
 from pathlib import Path
 import logging
@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 
 from biocypher import BioCypher
 from utils.filehandler import FileHandler
+from utils.yaml_loader import load_yaml
 from adapters.hpo.phenotype_hpoa_adapter import PhenotypeHpoaAdapter
 from adapters.hpo.phenotype_to_genes_adapter import PhenotypeToGenesAdapter
 from adapters.hpo.genes_to_disease_adapter import GenesToDiseaseAdapter
@@ -36,10 +37,7 @@ def load_hpo_config(config_path="/app/config/hpo_column_config.yaml"):
         Dictionary containing HPO configuration
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        return config
+        return load_yaml(config_path)
     
     except Exception as e:
         logger.error(f"Error loading HPO config: {e}")
@@ -110,7 +108,7 @@ def download_hpo_file(url, local_path):
         response.raise_for_status()
         
         with open(local_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
                 f.write(chunk)
         
         logger.info(f"Successfully downloaded {url} -> {local_path}")
@@ -120,18 +118,21 @@ def download_hpo_file(url, local_path):
         logger.error(f"Failed to download {url}: {e}")
         return False
 
-def create_adapters(data_files, use_urls=False):
+def create_adapters(data_files, use_urls=False, workers=None):
     """
     Create HPO adapters for each data file, with support for URL downloads
     
     Args:
         data_files: Dictionary with file paths or URL configurations
         use_urls: Boolean indicating if data_files contains URL configurations
+        workers: Number of processes to parse the files in (parsed serially
+            when unset or 1)
         
     Returns:
         List of adapter instances
     """
-    adapters = []
+    # (adapter class, file path) pairs, parsed together at the end
+    specs = []
     
     if use_urls:
         # Handle URL-based configuration
@@ -145,13 +146,13 @@ def create_adapters(data_files, use_urls=False):
                     # Create appropriate adapter based on dataset name
                     if dataset_name == 'phenotype_hpoa':
                         logger.info(f"Creating PhenotypeHpoaAdapter for {local_path}")
-                        adapters.append(PhenotypeHpoaAdapter(local_path))
+                        specs.append((PhenotypeHpoaAdapter, local_path))
                     elif dataset_name == 'phenotype_to_genes':
                         logger.info(f"Creating PhenotypeToGenesAdapter for {local_path}")
-                        adapters.append(PhenotypeToGenesAdapter(local_path))
+                        specs.append((PhenotypeToGenesAdapter, local_path))
                     elif dataset_name == 'genes_to_disease':
                         logger.info(f"Creating GenesToDiseaseAdapter for {local_path}")
-                        adapters.append(GenesToDiseaseAdapter(local_path))
+                        specs.append((GenesToDiseaseAdapter, local_path))
                     else:
                         logger.warning(f"Unknown dataset type: {dataset_name}")
                 else:
@@ -162,7 +163,7 @@ def create_adapters(data_files, use_urls=False):
             file_path = data_files['phenotype_hpoa']
             if os.path.exists(file_path):
                 logger.info(f"Creating PhenotypeHpoaAdapter for {file_path}")
-                adapters.append(PhenotypeHpoaAdapter(file_path))
+                specs.append((PhenotypeHpoaAdapter, file_path))
             else:
                 logger.warning(f"HPO phenotype.hpoa file not found: {file_path}")
         
@@ -170,7 +171,7 @@ def create_adapters(data_files, use_urls=False):
             file_path = data_files['phenotype_to_genes']
             if os.path.exists(file_path):
                 logger.info(f"Creating PhenotypeToGenesAdapter for {file_path}")
-                adapters.append(PhenotypeToGenesAdapter(file_path))
+                specs.append((PhenotypeToGenesAdapter, file_path))
             else:
                 logger.warning(f"HPO phenotype_to_genes.txt file not found: {file_path}")
         
@@ -178,11 +179,61 @@ def create_adapters(data_files, use_urls=False):
             file_path = data_files['genes_to_disease']
             if os.path.exists(file_path):
                 logger.info(f"Creating GenesToDiseaseAdapter for {file_path}")
-                adapters.append(GenesToDiseaseAdapter(file_path))
+                specs.append((GenesToDiseaseAdapter, file_path))
             else:
                 logger.warning(f"HPO genes_to_disease.txt file not found: {file_path}")
     
-    return adapters
+    return _construct_adapters(specs, workers)
+
+def _construct_adapters(specs, workers=None):
+    """
+    Instantiate (and so parse) the adapters. The files are independent, so
+    with more than one worker each is parsed in its own process and the
+    parsed adapter is sent back.
+    
+    Args:
+        specs: List of (adapter class, file path) pairs
+        workers: Number of worker processes
+        
+    Returns:
+        List of adapter instances, in the order of specs
+    """
+    if not workers or workers < 2 or len(specs) < 2:
+        return [_construct_adapter(spec) for spec in specs]
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(specs))) as executor:
+        return list(executor.map(_construct_adapter, specs))
+
+def _construct_adapter(spec):
+    """Instantiate one adapter from an (adapter class, file path) pair"""
+    adapter_class, file_path = spec
+    return adapter_class(file_path)
+
+def _stream_from_adapters(adapters, kind, counts):
+    """
+    Yield the nodes or edges of each adapter in turn, counting them per
+    adapter as they are consumed
+    
+    Args:
+        adapters: List of adapter instances
+        kind: "nodes" or "edges"
+        counts: Dictionary filled with adapter class name -> count
+        
+    Yields:
+        Node or edge tuples
+    """
+    for adapter in adapters:
+        name = adapter.__class__.__name__
+        logger.info(f"Processing {kind} from {name}")
+        
+        count = 0
+        items = adapter.get_nodes() if kind == "nodes" else adapter.get_edges()
+        for item in items:
+            count += 1
+            yield item
+        
+        counts[name] = count
+        logger.info(f"Added {count} {kind} from {name}")
 
 def build_hpo_knowledge_graph(config_path="/app/config/hpo_column_config.yaml", 
                               output_dir="/app/output/hpo",
@@ -225,7 +276,8 @@ def build_hpo_knowledge_graph(config_path="/app/config/hpo_column_config.yaml",
         logger.info(f"Using URL-based downloads: {use_urls}")
         
         # Create adapters
-        adapters = create_adapters(data_files, use_urls)
+        workers = hpo_config.get('global', {}).get('parse_workers')
+        adapters = create_adapters(data_files, use_urls, workers)
         
         if not adapters:
             logger.warning("No valid HPO adapters created - no data files found")
@@ -263,46 +315,27 @@ def build_hpo_knowledge_graph(config_path="/app/config/hpo_column_config.yaml",
         # Set output directory manually
         bc.output_dir = output_dir
         
-        # Process nodes from all adapters
-        logger.info("Processing nodes...")
-        all_nodes = []
-        
-        for adapter in adapters:
-            logger.info(f"Processing nodes from {adapter.__class__.__name__}")
-            adapter_nodes = list(adapter.get_nodes())
-            all_nodes.extend(adapter_nodes)
-            logger.info(f"Added {len(adapter_nodes)} nodes from {adapter.__class__.__name__}")
-        
-        logger.info(f"Total nodes collected: {len(all_nodes)}")
-        
-        # Process edges from all adapters
-        logger.info("Processing edges...")
-        all_edges = []
-        
-        for adapter in adapters:
-            logger.info(f"Processing edges from {adapter.__class__.__name__}")
-            adapter_edges = list(adapter.get_edges())
-            all_edges.extend(adapter_edges)
-            logger.info(f"Added {len(adapter_edges)} edges from {adapter.__class__.__name__}")
-        
-        logger.info(f"Total edges collected: {len(all_edges)}")
-        
-        # Write knowledge graph
+        # Write knowledge graph, streaming each adapter's nodes and edges
+        # into BioCypher instead of collecting them in lists first
         logger.info("Writing knowledge graph...")
+        node_counts = {}
+        edge_counts = {}
         
         # Write nodes
+        logger.info("Processing nodes...")
         try:
-            bc.write_nodes(all_nodes)
-            logger.info(f"Successfully wrote {len(all_nodes)} nodes")
+            bc.write_nodes(_stream_from_adapters(adapters, "nodes", node_counts))
+            logger.info(f"Successfully wrote {sum(node_counts.values())} nodes")
         except Exception as e:
             logger.error(f"Error writing nodes: {e}")
             import traceback
             traceback.print_exc()
         
         # Write edges
+        logger.info("Processing edges...")
         try:
-            bc.write_edges(all_edges)
-            logger.info(f"Successfully wrote {len(all_edges)} edges")
+            bc.write_edges(_stream_from_adapters(adapters, "edges", edge_counts))
+            logger.info(f"Successfully wrote {sum(edge_counts.values())} edges")
         except Exception as e:
             logger.error(f"Error writing edges: {e}")
             import traceback
@@ -320,8 +353,8 @@ def build_hpo_knowledge_graph(config_path="/app/config/hpo_column_config.yaml",
             "status": "success",
             "duration": duration,
             "output_dir": output_dir,
-            "nodes": len(all_nodes),
-            "edges": len(all_edges),
+            "nodes": sum(node_counts.values()),
+            "edges": sum(edge_counts.values()),
             "adapters_used": len(adapters),
             "summary": summary
         }
@@ -19,7 +19,7 @@ from biocypher import BioCypher
 from adapters.mesh.mesh_nt_adapter import MeshAdapterComprehensive
 from utils.neptune_converter import convert_to_neptune
 
-def build_mesh_nt_knowledge_graph(input_file=None, output_dir=None, convert_to_neptune_format=False):
+def build_mesh_nt_knowledge_graph(input_file=None, output_dir=None, convert_to_neptune_format=False, workers=None):
     """
     Build MESH knowledge graph from NT file using BioCypher
     
@@ -27,6 +27,7 @@ def build_mesh_nt_knowledge_graph(input_file=None, output_dir=None, convert_to_n
         input_file: Path to the MESH NT file
         output_dir: Directory to output the knowledge graph
         convert_to_neptune_format: Whether to convert the output to Neptune format
+        workers: Number of processes to parse the NT file with (serial if unset)
     """
     start_time = time.time()
     
@@ -46,7 +47,7 @@ def build_mesh_nt_knowledge_graph(input_file=None, output_dir=None, convert_to_n
     )
     
     # Use the comprehensive adapter
-    adapter = MeshAdapterComprehensive(input_file)
+    adapter = MeshAdapterComprehensive(input_file, workers=workers)
     
     logger.info(f"Adapter initialization took: {time.time() - start_time:.2f} seconds")
     
@@ -138,13 +139,15 @@ def main():
     parser.add_argument("--input-file", "-i", help="Path to the MESH NT file")
     parser.add_argument("--output-dir", "-o", help="Output directory for the knowledge graph")
     parser.add_argument("--neptune", "-n", action="store_true", help="Convert output to Neptune format")
+    parser.add_argument("--workers", "-w", type=int, help="Number of processes to parse the NT file with")
     args = parser.parse_args()
     
     try:
         output_dir = build_mesh_nt_knowledge_graph(
             input_file=args.input_file,
             output_dir=args.output_dir,
-            convert_to_neptune_format=args.neptune
+            convert_to_neptune_format=args.neptune,
+            workers=args.workers
         )
         
         logger.info("\n" + "=" * 60)
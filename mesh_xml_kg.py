@@ -19,7 +19,7 @@ from biocypher import BioCypher
 from adapters.mesh.mesh_xml_adapter import MeshXmlAdapter
 from utils.neptune_converter import convert_to_neptune
 
-def build_mesh_xml_knowledge_graph(input_file=None, output_dir=None, convert_to_neptune_format=False):
+def build_mesh_xml_knowledge_graph(input_file=None, output_dir=None, convert_to_neptune_format=False, workers=None):
     """
     Build MESH knowledge graph from XML file using BioCypher
     
@@ -27,6 +27,7 @@ def build_mesh_xml_knowledge_graph(input_file=None, output_dir=None, convert_to_
         input_file: Path to the MESH XML file
         output_dir: Directory to output the knowledge graph
         convert_to_neptune_format: Whether to convert the output to Neptune format
+        workers: Number of processes to parse the XML file with (serial if unset)
     """
     start_time = time.time()
     
@@ -46,7 +47,7 @@ def build_mesh_xml_knowledge_graph(input_file=None, output_dir=None, convert_to_
     )
     
     # Use the XML adapter
-    adapter = MeshXmlAdapter(input_file)
+    adapter = MeshXmlAdapter(input_file, workers=workers)
     
     logger.info(f"Adapter initialization took: {time.time() - start_time:.2f} seconds")
     
@@ -159,13 +160,15 @@ def main():
     parser.add_argument("--input-file", "-i", help="Path to the MESH XML file")
     parser.add_argument("--output-dir", "-o", help="Output directory for the knowledge graph")
     parser.add_argument("--neptune", "-n", action="store_true", help="Convert output to Neptune format")
+    parser.add_argument("--workers", "-w", type=int, help="Number of processes to parse the XML file with")
     args = parser.parse_args()
     
     try:
         output_dir = build_mesh_xml_knowledge_graph(
             input_file=args.input_file,
             output_dir=args.output_dir,
-            convert_to_neptune_format=args.neptune
+            convert_to_neptune_format=args.neptune,
+            workers=args.workers
         )
         
         logger.info("\n" + "=" * 60)
@@ -11,6 +11,7 @@ import shutil
 import yaml
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configure logging
@@ -346,51 +347,75 @@ def convert_to_neptune_format(biocypher_dir, neptune_dir, builder_name=""):
         print(f"Error converting to Neptune format: {e}")
         return None
 
-def upload_to_s3(neptune_dir, s3_config, builder_name):
-    """Upload Neptune files to S3"""
+def s3_output_prefix(s3_config, builder_name, timestamp=None):
+    """
+    S3 key prefix for a builder's Neptune files, shared by the upload and
+    the Neptune load so both use the same location
+    
+    Args:
+        s3_config: S3 section of the config
+        builder_name: Name of the builder
+        timestamp: Upload timestamp (defaults to the current time)
+        
+    Returns:
+        Key prefix, without a trailing slash
+    """
+    timestamp = timestamp or time.strftime("%Y%m%d%H%M%S")
+    s3_prefix = s3_config.get('prefix', '')
+    if not s3_prefix:
+        return f"{builder_name}_kg/{timestamp}"
+    
+    # Add builder name and timestamp to prefix
+    return f"{s3_prefix}/{builder_name}/{timestamp}"
+
+def upload_to_s3(neptune_dir, s3_config, builder_name, timestamp=None):
+    """Upload Neptune files to S3 (under the given or the current timestamp)"""
     try:
         import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
         from botocore.exceptions import ClientError, NoCredentialsError
         
         s3_bucket = s3_config.get('bucket')
-        s3_prefix = s3_config.get('prefix', '')
+        upload_workers = max(1, s3_config.get('upload_workers', 16) or 1)
         
         if not s3_bucket:
             print("No S3 bucket specified")
             return []
         
-        # Initialize S3 client
-        s3_client = boto3.client('s3')
+        # Initialize S3 client, with a connection per upload thread plus
+        # headroom for the multipart threads of large files
+        s3_client = boto3.client('s3', config=Config(max_pool_connections=upload_workers + 16))
+        transfer_config = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=4)
         
         logger.info(f"\nUploading {builder_name} Neptune files to S3 bucket {s3_bucket}...")
         
         # Create S3 prefix with timestamp if not provided
-        if not s3_prefix:
-            timestamp = time.strftime("%Y%m%d%H%M%S")
-            s3_prefix = f"{builder_name}_kg/{timestamp}"
-        else:
-            # Add builder name and timestamp to prefix
-            timestamp = time.strftime("%Y%m%d%H%M%S")
-            s3_prefix = f"{s3_prefix}/{builder_name}/{timestamp}"
+        s3_prefix = s3_output_prefix(s3_config, builder_name, timestamp)
+        
+        def upload_one(file_path):
+            # Calculate relative path for S3 key
+            relative_path = file_path.relative_to(neptune_path)
+            s3_key = f"{s3_prefix}/{relative_path}"
+            
+            try:
+                s3_client.upload_file(str(file_path), s3_bucket, s3_key, Config=transfer_config)
+                s3_uri = f"s3://{s3_bucket}/{s3_key}"
+                print(f"✅ Uploaded: {s3_uri}")
+                return s3_uri
+            except ClientError as e:
+                print(f"❌ Failed to upload {file_path}: {e}")
+                return None
         
-        # Upload files
+        # Upload files; the many small part files are dominated by request
+        # latency, so they go up over a pool of threads sharing the client
         uploaded_uris = []
         neptune_path = Path(neptune_dir)
         
         if neptune_path.exists():
-            for file_path in neptune_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate relative path for S3 key
-                    relative_path = file_path.relative_to(neptune_path)
-                    s3_key = f"{s3_prefix}/{relative_path}"
-                    
-                    try:
-                        s3_client.upload_file(str(file_path), s3_bucket, s3_key)
-                        s3_uri = f"s3://{s3_bucket}/{s3_key}"
-                        uploaded_uris.append(s3_uri)
-                        print(f"✅ Uploaded: {s3_uri}")
-                    except ClientError as e:
-                        print(f"❌ Failed to upload {file_path}: {e}")
+            file_paths = [p for p in neptune_path.rglob('*') if p.is_file()]
+            with ThreadPoolExecutor(max_workers=upload_workers) as executor:
+                uploaded_uris = [uri for uri in executor.map(upload_one, file_paths) if uri]
         
         logger.info(f"Uploaded {len(uploaded_uris)} files to S3")
         return uploaded_uris
@@ -402,15 +427,17 @@ def upload_to_s3(neptune_dir, s3_config, builder_name):
         print(f"Error uploading to S3: {e}")
         return []
 
-def load_to_neptune(s3_uris, s3_config, neptune_config, builder_name):
-    """Load data from S3 to Neptune with proper ordering (nodes first, then edges)"""
+def load_to_neptune(s3_uris, s3_config, neptune_config, builder_name, timestamp=None):
+    """
+    Load data from S3 to Neptune with proper ordering (nodes first, then edges),
+    from the prefix upload_to_s3 used for the same timestamp
+    """
     try:
         from utils.neptune_loader import NeptuneLoader
         
         neptune_endpoint = neptune_config.get('endpoint')
         iam_role_arn = neptune_config.get('iam_role_arn')
         s3_bucket = s3_config.get('bucket')
-        s3_prefix = s3_config.get('prefix', '')
         
         if not all([neptune_endpoint, iam_role_arn, s3_bucket]):
             print("Missing Neptune configuration")
@@ -419,11 +446,7 @@ def load_to_neptune(s3_uris, s3_config, neptune_config, builder_name):
         loader = NeptuneLoader(neptune_endpoint, iam_role_arn)
         
         # Construct S3 directory URI
-        timestamp = time.strftime("%Y%m%d%H%M%S")
-        if not s3_prefix:
-            s3_source_uri = f"s3://{s3_bucket}/{builder_name}_kg/{timestamp}/"
-        else:
-            s3_source_uri = f"s3://{s3_bucket}/{s3_prefix}/{builder_name}/{timestamp}/"
+        s3_source_uri = f"s3://{s3_bucket}/{s3_output_prefix(s3_config, builder_name, timestamp)}/"
         
         print(f"🚀 Starting ordered Neptune load from: {s3_source_uri}")
         print("   Loading nodes first, then edges to prevent reference errors...")
@@ -460,6 +483,36 @@ def load_to_neptune(s3_uris, s3_config, neptune_config, builder_name):
         import traceback
         traceback.print_exc()
 
+def process_output_directory(subdir_path, builder_name, s3_config, upload_to_s3_enabled):
+    """
+    Convert one BioCypher output directory to Neptune format and upload it
+    to S3 if enabled
+    
+    Returns:
+        (neptune_dir or None, uploaded S3 URIs, upload timestamp)
+    """
+    subdir = Path(subdir_path)
+    
+    if not subdir.exists():
+        print(f"⚠️  Directory not found: {subdir}")
+        return None, [], None
+    
+    print(f"Processing BioCypher output: {subdir} (builder: {builder_name})")
+    
+    # Create builder-specific neptune subdirectory
+    neptune_subdir = f'/workspace/neptune/{builder_name}_{subdir.name}'
+    
+    # Convert to Neptune format
+    neptune_result = convert_to_neptune_format(str(subdir), neptune_subdir, builder_name)
+    
+    s3_uris = []
+    timestamp = time.strftime("%Y%m%d%H%M%S")
+    if neptune_result and upload_to_s3_enabled:
+        # Upload to S3
+        s3_uris = upload_to_s3(neptune_result, s3_config, builder_name, timestamp)
+    
+    return neptune_result, s3_uris, timestamp
+
 def organize_outputs(builder_results, config):
     """Organize all outputs in workspace and handle S3/Neptune operations"""
     try:
@@ -488,30 +541,25 @@ def organize_outputs(builder_results, config):
             print(f"\nProcessing directories created in current run:")
             print(f"Current run directories: {CURRENT_RUN_DIRECTORIES}")
             
-            # Process only directories created in current run
-            for subdir_path, builder_name in CURRENT_RUN_DIRECTORIES.items():
-                subdir = Path(subdir_path)
-                
-                if not subdir.exists():
-                    print(f"⚠️  Directory not found: {subdir}")
-                    continue
-                
-                print(f"Processing BioCypher output: {subdir} (builder: {builder_name})")
-                
-                # Create builder-specific neptune subdirectory
-                neptune_subdir = f'/workspace/neptune/{builder_name}_{subdir.name}'
-                
-                # Convert to Neptune format
-                neptune_result = convert_to_neptune_format(str(subdir), neptune_subdir, builder_name)
+            # Process only directories created in current run. The
+            # directories are independent, so several can be converted and
+            # uploaded at once; Neptune runs one bulk load at a time, so the
+            # loads below stay sequential, in builder order
+            max_parallel_outputs = max(1, general_config.get('max_parallel_outputs', 1) or 1)
+            with ThreadPoolExecutor(max_workers=max_parallel_outputs) as executor:
+                futures = [
+                    executor.submit(process_output_directory, subdir_path, builder_name,
+                                    s3_config, upload_to_s3_enabled)
+                    for subdir_path, builder_name in CURRENT_RUN_DIRECTORIES.items()
+                ]
                 
-                if neptune_result and upload_to_s3_enabled:
-                    # Upload to S3
-                    s3_uris = upload_to_s3(neptune_result, s3_config, builder_name)
+                for builder_name, future in zip(CURRENT_RUN_DIRECTORIES.values(), futures):
+                    neptune_result, s3_uris, timestamp = future.result()
                     all_s3_uris.extend(s3_uris)
                     
                     if s3_uris and load_to_neptune_enabled:
                         # Load to Neptune
-                        load_to_neptune(s3_uris, s3_config, neptune_config, builder_name)
+                        load_to_neptune(s3_uris, s3_config, neptune_config, builder_name, timestamp)
         
         print("All outputs organized in workspace")
         
@@ -41,11 +41,16 @@ class FileHandler:
         # Download file
         self.logger.info(f"Downloading {name} from {url}")
         try:
-            response = requests.get(url, timeout=60)
+            response = requests.get(url, timeout=60, stream=True)
             response.raise_for_status()
             
-            with open(file_path, "wb") as f:
-                f.write(response.content)
+            # Stream the file to disk as downloaded; rename it into place
+            # once complete, so a failed download is not taken as cached
+            partial_path = file_path.with_name(f"{file_path.name}.part")
+            with open(partial_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+            os.replace(partial_path, file_path)
             
             self.logger.info(f"Downloaded {name} to {file_path}")
             return file_path
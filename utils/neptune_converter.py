@@ -4,7 +4,6 @@ Convert Neo4j CSV files to Neptune format
 
 import pandas as pd
 import os
-import re
 import glob
 import math
 import csv
@@ -79,30 +78,16 @@ class Neo4jToNeptuneConverter:
         if series.isnull().all():
             return "String"
 
-        def is_int(x):
-            return re.fullmatch(r"-?\d+", x) is not None
-
-        def is_float(x):
-            return re.fullmatch(r"-?\d+\.\d*", x) is not None
-
-        def is_bool(x):
-            return x.lower() in ["true", "false"]
-
-        def is_date(x):
-            return (
-                re.fullmatch(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2}(Z)?)?)?", x)
-                is not None
-            )
-
+        # Whole-column string checks, rather than a Python call per value
         non_null = series.dropna().astype(str).str.strip(" '\"")
 
-        if non_null.apply(is_bool).all():
+        if non_null.str.lower().isin(["true", "false"]).all():
             return "Bool"
-        if non_null.apply(is_int).all():
+        if non_null.str.fullmatch(r"-?\d+").all():
             return "Int"
-        if non_null.apply(is_float).all():
+        if non_null.str.fullmatch(r"-?\d+\.\d*").all():
             return "Double"
-        if non_null.apply(is_date).all():
+        if non_null.str.fullmatch(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2}(Z)?)?)?").all():
             return "Date"
         return "String"
 
@@ -141,13 +126,9 @@ class Neo4jToNeptuneConverter:
     
     def clean_labels(self, df, headers):
         if ":LABEL" in headers:
-            df[":LABEL"] = df[":LABEL"].apply(
-                lambda l: l.replace("|", ";") if pd.notna(l) else ""
-            )
+            df[":LABEL"] = df[":LABEL"].str.replace("|", ";", regex=False).fillna("")
         elif ":TYPE" in headers:
-            df[":TYPE"] = df[":TYPE"].apply(
-                lambda l: l.split("|")[0] if pd.notna(l) else ""
-            )
+            df[":TYPE"] = df[":TYPE"].str.split("|", n=1).str[0].fillna("")
         return df
 
     def process_batches(self, base_name, header_file, part_files):
@@ -182,9 +163,7 @@ class Neo4jToNeptuneConverter:
             # Apply string cleaning to each column that contains string data
             for col in batch_df.columns:
                 if batch_df[col].dtype == 'object':  # Only apply to string/object columns
-                    batch_df[col] = batch_df[col].map(
-                        lambda x: x.strip(" '\"\t\r\n") if isinstance(x, str) else x
-                    )
+                    batch_df[col] = batch_df[col].str.strip(" '\"\t\r\n")
             batch_df = self.clean_labels(batch_df, headers)
 
             new_headers = self.convert_headers(headers, batch_df, file_type)
@@ -0,0 +1,21 @@
+"""
+Utility for loading YAML configuration files
+"""
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def load_yaml(file_path):
+    """
+    Load a YAML file with the safe loader
+    
+    Args:
+        file_path: Path to the YAML file
+        
+    Returns:
+        The parsed YAML document
+    """
+    with open(file_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)